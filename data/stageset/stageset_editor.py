@@ -8,7 +8,9 @@ continue to work without losing the Mission Actors tab.
 from __future__ import annotations
 
 from pathlib import Path
+import queue
 import sys
+import threading
 
 
 def _ensure_project_root_on_path() -> None:
@@ -24,8 +26,48 @@ _ensure_project_root_on_path()
 from bbmods_debug_editor import BBMODSDebugEditor  # noqa: E402  pylint: disable=wrong-import-position
 
 
+SERVE_FLAG = "--serve"
+SERVE_POLL_MS = 100
+
+
+def _read_commands(commands: "queue.Queue[str]") -> None:
+    # Blocking stdin reads stay off the Tk thread; EOF means the launcher went away.
+    for line in sys.stdin:
+        commands.put(line.strip())
+    commands.put("EOF")
+
+
+def _serve(editor: BBMODSDebugEditor) -> None:
+    """Keep the editor warm for the launcher: closing hides it, "SHOW" brings it back."""
+    commands: "queue.Queue[str]" = queue.Queue()
+    threading.Thread(target=_read_commands, args=(commands,), daemon=True).start()
+    editor.protocol("WM_DELETE_WINDOW", editor.withdraw)
+
+    def poll() -> None:
+        while True:
+            try:
+                command = commands.get_nowait()
+            except queue.Empty:
+                break
+            if command == "SHOW":
+                editor.deiconify()
+                editor.lift()
+                editor.focus_force()
+            elif command == "EOF":
+                # Launcher closed: a hidden editor exits, a visible one closes normally later.
+                editor.protocol("WM_DELETE_WINDOW", editor.destroy)
+                if editor.state() == "withdrawn":
+                    editor.destroy()
+                return
+        editor.after(SERVE_POLL_MS, poll)
+
+    editor.after(SERVE_POLL_MS, poll)
+
+
 def main() -> None:
     editor = BBMODSDebugEditor()
+    if SERVE_FLAG in sys.argv[1:]:
+        _serve(editor)
     editor.mainloop()
 
 
@@ -1,23 +1,46 @@
 import sys
 import ctypes
 from ctypes import wintypes
+import hashlib
 import html
+import os
+import re
+import shutil
+import struct
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Callable, List, cast
+from typing import Any, Dict, Callable, NamedTuple, cast
 
 import psutil
-from PySide6.QtGui import QTextCursor, QKeySequence, QKeyEvent, QCloseEvent
+from PySide6.QtGui import (
+    QTextCursor,
+    QKeySequence,
+    QKeyEvent,
+    QCloseEvent,
+    QShowEvent,
+    QColor,
+    QFont,
+    QPalette,
+    QPainter,
+    QStaticText,
+    QTransform,
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QHBoxLayout, QVBoxLayout, QFrame,
     QLabel, QPushButton, QGraphicsOpacityEffect, QScrollArea,
-    QGridLayout, QDialog, QTextEdit, QMessageBox,
-    QListWidget, QListWidgetItem, QLineEdit
+    QGridLayout, QDialog, QPlainTextEdit, QMessageBox,
+    QListView, QLineEdit, QSizePolicy
+)
+from PySide6.QtCore import (
+    Qt, QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QEvent, QObject,
+    QRunnable, QThreadPool, Signal, QAbstractListModel, QModelIndex, QSize
 )
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, QAbstractAnimation, QEvent, QObject
 
 
 VS_BG = "#1e1e1e"        # main background
@@ -26,7 +49,12 @@ VS_TABBAR = "#2d2d2d"    # tab row
 VS_STATUS = "#007acc"    # VS Code accent (for status bar)
 VS_TEXT = "#d4d4d4"      # default text
 
+# Intro typewriter: same ~35 ms/char pace, but one repaint per batch of characters.
+INTRO_CHARS_PER_TICK = 4
+INTRO_TICK_MS = 35 * INTRO_CHARS_PER_TICK
+
 SKILL_DATA_ROOT = Path(__file__).resolve().parent / "data" / "skills"
+SKILL_LOAD_WORKERS = 8
 TOTAL_SKILLS = sum(1 for _ in SKILL_DATA_ROOT.glob("*/meta.yaml"))
 
 # Capsule classification palette; expand as additional capsule types gain bespoke colors.
@@ -41,13 +69,173 @@ CAPSULE_TYPE_COLORS: dict[str, str] = {
 }
 CAPSULE_BADGE_TEXT_COLOR = "#1b1b1b"
 
+
+def _frame_qss(background: str, border: str) -> str:
+    return (
+        "QFrame {"
+        f"background-color: {background};"
+        f"border: 1px solid {border};"
+        "border-radius: 3px;"
+        "}"
+    )
+
+
+def _button_qss(padding: str) -> str:
+    return (
+        "QPushButton {"
+        "background-color: #3c3c3c;"
+        "color: #ffffff;"
+        "border: 1px solid #4a4a4a;"
+        "border-radius: 3px;"
+        f"padding: {padding};"
+        "font-size: 12px;"
+        "}"
+        "QPushButton:hover {"
+        "background-color: #4b4b4b;"
+        "}"
+    )
+
+
+def _blink_button_qss(color: str) -> str:
+    return (
+        "QPushButton {"
+        f"background-color: {color};"
+        "color: #1b1b1b;"
+        "border: 1px solid #806000;"
+        "border-radius: 3px;"
+        "padding: 4px 10px;"
+        "font-size: 12px;"
+        "font-weight: bold;"
+        "}"
+        "QPushButton:hover {"
+        "background-color: #ffe699;"
+        "}"
+    )
+
+
+# Chrome palettes/fonts are built once (after QApplication exists) and shared,
+# so the bars and status labels skip a stylesheet parse per widget.
+@lru_cache(maxsize=None)
+def _fill_palette(background: str, text: str | None = None) -> QPalette:
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(background))
+    if text is not None:
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(text))
+    return palette
+
+
+@lru_cache(maxsize=None)
+def _status_font() -> QFont:
+    font = QFont()
+    font.setPixelSize(11)
+    return font
+
+
+def _apply_fill(widget: QWidget, background: str, text: str | None = None) -> None:
+    widget.setAutoFillBackground(True)
+    widget.setPalette(_fill_palette(background, text))
+
+
+def _menu_button_qss(expanded: bool, highlighted: bool) -> str:
+    base_color = "#394049" if expanded else "#333333"
+    hover_color = "#46505c" if expanded else "#3d3d3d"
+    text_color = "#ffffff" if highlighted else "#dcdcdc"
+    return (
+        "QPushButton {"
+        f"background-color: {base_color};"
+        f"color: {text_color};"
+        "border: none;"
+        "padding: 6px 10px;"
+        "text-align: left;"
+        "font-size: 13px;"
+        "}"
+        "QPushButton:hover {"
+        f"background-color: {hover_color};"
+        "}"
+        "QPushButton:pressed {"
+        "background-color: #2d2d2d;"
+        "}"
+        # Collapsed sections while another is open: the old 35% opacity, pre-blended.
+        "QPushButton[dim=\"true\"] {"
+        "background-color: #292929;"
+        "color: #646464;"
+        "}"
+        "QPushButton[dim=\"true\"]:hover {"
+        "background-color: #2d2d2d;"
+        "}"
+    )
+
+
+MENU_SECTION_QSS = (
+    "QFrame {"
+    "background-color: #1e1e1e;"
+    "border: 1px solid #333333;"
+    "border-radius: 3px;"
+    "}"
+    "QFrame[dim=\"true\"] {"
+    "background-color: #222222;"
+    "border-color: #292929;"
+    "}"
+)
+
+
+# Shared stylesheets: every widget using the same look gets the same string object.
+HEADER_FRAME_QSS = _frame_qss("#2b2b2b", "#3a3a3a")
+PANEL_FRAME_QSS = _frame_qss("#262626", "#333333")
+FIELD_FRAME_QSS = _frame_qss("#2e2e2e", "#3b3b3b")
+SECTION_FRAME_QSS = _frame_qss("#2a2a2a", "#3a3a3a")
+DIALOG_BUTTON_QSS = _button_qss("6px 14px")
+PAGER_BUTTON_QSS = _button_qss("4px")
+MENU_ACTION_BUTTON_QSS = _button_qss("4px 10px")
+
 # Skill memory layout constants derived from in-game analysis.
 SKILL_BLOCK_SIZE = 0x90
 SKILL_TABLE_POINTER_OFFSET = 0x32558
 FIRST_SKILL_RELATIVE_OFFSET = 0x32558
 MAX_SKILL_INDEX = 0x2F0  # 752 skills in the retail build
+# Precomputed skill lookups: hex ids as spelled in meta.yaml map straight to indices.
+_SKILL_INDEX_BY_HEX: dict[str, int] = {
+    spelling: index
+    for index in range(MAX_SKILL_INDEX)
+    for spelling in (f"0x{index:04X}", f"0x{index:04x}", f"{index:04X}", f"{index:04x}")
+}
+_SKILL_BLOCK_OFFSETS = tuple(index * SKILL_BLOCK_SIZE for index in range(MAX_SKILL_INDEX))
+
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Long dumps are validated in one regex pass instead of a per-character walk;
+# short edits keep the plain loop, which is cheaper below this size.
+HEX_SCAN_THRESHOLD = 256
+_INVALID_HEX_TOKEN_RE = re.compile(r"(?<!\S)(?![0-9A-Fa-f]{2}(?!\S))\S+")
+VALIDATION_CACHE_SIZE = 8
 
-HEX_DIGITS = set("0123456789abcdefABCDEF")
+# One "key: value" line of meta.yaml; comment and list lines are skipped.
+_META_LINE_RE = re.compile(r"^(?![^\S\n]*[#-])([^:\n]*):(.*)$", re.M)
+
+# Keys that would change the dump's size and are rejected while editing hex.
+_BLOCKED_HEX_EDIT_KEYS = frozenset(
+    {Qt.Key.Key_Backspace, Qt.Key.Key_Delete, Qt.Key.Key_Return, Qt.Key.Key_Enter, Qt.Key.Key_Tab}
+)
+_SHORTCUT_MODIFIERS = (
+    Qt.KeyboardModifier.ControlModifier
+    | Qt.KeyboardModifier.ShiftModifier
+    | Qt.KeyboardModifier.AltModifier
+    | Qt.KeyboardModifier.MetaModifier
+)
+# Dedicated clipboard/undo keys that platforms bind to standard shortcuts without modifiers.
+_UNMODIFIED_SHORTCUT_KEYS = frozenset(
+    {
+        Qt.Key.Key_Copy,
+        Qt.Key.Key_Cut,
+        Qt.Key.Key_Paste,
+        Qt.Key.Key_Undo,
+        Qt.Key.Key_Redo,
+        Qt.Key.Key_F14,
+        Qt.Key.Key_F16,
+        Qt.Key.Key_F18,
+        Qt.Key.Key_F20,
+    }
+)
 
 # Precomputed handshake vector keeps the legacy tooling probe deterministic.
 _LEGACY_TOOLING_VECTOR = (
@@ -142,6 +330,8 @@ _LEGACY_TOOLING_VECTOR = (
     96,
 )
 
+PDUWP_PROCESS_NAMES = frozenset({"pduwp.exe", "pduwp"})
+
 BACKUP_FILENAME = "skill_data.original.txt"
 TEMP_EDIT_PREFIX = "Tempory edit "
 
@@ -152,8 +342,18 @@ PROCESS_VM_WRITE = 0x0020
 PROCESS_ACCESS_FLAGS = (
     PROCESS_QUERY_INFORMATION | PROCESS_VM_OPERATION | PROCESS_VM_READ | PROCESS_VM_WRITE
 )
+SYNCHRONIZE = 0x00100000
+WAIT_OBJECT_0 = 0x00000000
+INFINITE = 0xFFFFFFFF
+# PDUWP exit is pushed by a wait on its process handle; polling only finds new launches.
+PROCESS_POLL_MS = 2000
+PROCESS_POLL_WATCHED_MS = 30000
+# Ranges closer together than this are fetched with one ReadProcessMemory call.
+SCATTER_READ_SPAN_LIMIT = 1 << 20
 LIST_MODULES_ALL = 0x03
 MAX_MODULE_PATH = 512
+_POINTER_SIZE = ctypes.sizeof(ctypes.c_void_p)
+_POINTER_STRUCT = struct.Struct("<Q" if _POINTER_SIZE == 8 else "<I")
 
 # Reference module base observed during offset discovery.
 REFERENCE_MODULE_BASE = 0x7FF62B000000
@@ -179,6 +379,10 @@ LIVE_MEMORY_BLOCKS: dict[str, dict[str, int | str]] = {
         "label": "Psycho Burst",
     },
 }
+# Same block dicts indexed by skill index; LIVE_MEMORY_BLOCKS stays as the hex-keyed view.
+_LIVE_MEMORY_BLOCKS_BY_INDEX: list[dict[str, int | str] | None] = [
+    LIVE_MEMORY_BLOCKS.get(f"0x{index:04X}") for index in range(MAX_SKILL_INDEX)
+]
 
 
 class WindowsMemoryEditor:
@@ -204,6 +408,22 @@ class WindowsMemoryEditor:
         self._kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
         self._kernel32.CloseHandle.restype = wintypes.BOOL
         self._kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        self._kernel32.WaitForMultipleObjects.argtypes = [
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.HANDLE),
+            wintypes.BOOL,
+            wintypes.DWORD,
+        ]
+        self._kernel32.CreateEventW.restype = wintypes.HANDLE
+        self._kernel32.CreateEventW.argtypes = [
+            wintypes.LPVOID,
+            wintypes.BOOL,
+            wintypes.BOOL,
+            wintypes.LPCWSTR,
+        ]
+        self._kernel32.SetEvent.restype = wintypes.BOOL
+        self._kernel32.SetEvent.argtypes = [wintypes.HANDLE]
 
         self._kernel32.ReadProcessMemory.restype = wintypes.BOOL
         self._kernel32.ReadProcessMemory.argtypes = [
@@ -292,6 +512,32 @@ class WindowsMemoryEditor:
         self.module_path = module_path
         return True, f"Attached to PID {pid} (base 0x{base_address:016X})"
 
+    def open_exit_handle(self, pid: int) -> wintypes.HANDLE | None:
+        """Open a wait-only handle for ``pid``; independent of the attach handle."""
+        if not self._kernel32 or pid <= 0:
+            return None
+        return self._kernel32.OpenProcess(SYNCHRONIZE, False, pid) or None
+
+    def create_stop_event(self) -> wintypes.HANDLE | None:
+        """Manual-reset event that cancels a pending ``wait_for_exit``."""
+        if not self._kernel32:
+            return None
+        return self._kernel32.CreateEventW(None, True, False, None) or None
+
+    def set_event(self, handle: wintypes.HANDLE) -> None:
+        if self._kernel32:
+            self._kernel32.SetEvent(handle)
+
+    def wait_for_exit(self, handle: wintypes.HANDLE, stop_event: wintypes.HANDLE) -> bool:
+        """Block until the process exits (True); a set stop event or a failed wait gives False."""
+        assert self._kernel32 is not None
+        handles = (wintypes.HANDLE * 2)(handle, stop_event)
+        return self._kernel32.WaitForMultipleObjects(2, handles, False, INFINITE) == WAIT_OBJECT_0
+
+    def close_handle(self, handle: wintypes.HANDLE) -> None:
+        if self._kernel32:
+            self._kernel32.CloseHandle(handle)
+
     def _resolve_primary_module(self, handle: wintypes.HANDLE) -> tuple[int | None, str]:
         if not self._psapi:
             return None, ""
@@ -349,6 +595,25 @@ class WindowsMemoryEditor:
             return False, None, "ReadProcessMemory returned no data."
         return True, bytes(buffer[: read.value]), ""
 
+    def read_memory_scatter(self, ranges: list[tuple[int, int]]) -> list[bytes | None]:
+        """Read several (address, size) ranges, as one covering read when they sit close together."""
+        if not ranges:
+            return []
+        start = min(address for address, _ in ranges)
+        span = max(address + size for address, size in ranges) - start
+        if 0 < span <= SCATTER_READ_SPAN_LIMIT:
+            success, payload, _ = self.read_memory(start, span)
+            if success and payload is not None and len(payload) == span:
+                view = memoryview(payload)
+                return [bytes(view[address - start:address - start + size]) for address, size in ranges]
+
+        # Partial copy or widely scattered ranges: fall back to one read per range.
+        results: list[bytes | None] = []
+        for address, size in ranges:
+            success, payload, _ = self.read_memory(address, size)
+            results.append(payload if success else None)
+        return results
+
     def write_memory(self, address: int, data: bytes) -> tuple[bool, str]:
         if not self.attached or not self.handle or not self._kernel32:
             return False, "Process handle unavailable."
@@ -386,6 +651,12 @@ def format_hex_lines(tokens: list[str]) -> str:
     return "\n".join(lines)
 
 
+def format_hex_bytes(data: bytes) -> str:
+    """Format raw bytes straight into canonical 16-value rows."""
+    view = memoryview(data)
+    return "\n".join(view[i : i + 16].hex(" ").upper() for i in range(0, len(view), 16))
+
+
 def normalize_hex_text(text: str) -> str:
     """Normalize arbitrary whitespace-separated bytes into canonical rows."""
     return format_hex_lines(text.split())
@@ -393,20 +664,76 @@ def normalize_hex_text(text: str) -> str:
 
 def hex_token_stats(text: str) -> tuple[int, list[str]]:
     """Count two-digit hex tokens and collect invalid tokens."""
-    invalid: list[str] = []
     tokens = text.split()
+    if len(text) > HEX_SCAN_THRESHOLD:
+        return len(tokens), _INVALID_HEX_TOKEN_RE.findall(text)
+
+    invalid: list[str] = []
     for token in tokens:
         if len(token) != 2 or any(char not in HEX_DIGITS for char in token):
             invalid.append(token)
     return len(tokens), invalid
 
 
+# Save/revert/load re-examine the same dumps (file text, baselines, backups), so
+# their stats and canonical form are memoized by content.
+@lru_cache(maxsize=256)
+def _hex_token_stats_cached(text: str) -> tuple[int, tuple[str, ...]]:
+    pair_count, invalid_tokens = hex_token_stats(text)
+    return pair_count, tuple(invalid_tokens)
+
+
+def cached_hex_token_stats(text: str) -> tuple[int, list[str]]:
+    """hex_token_stats with memoization; the invalid list is a fresh copy per call."""
+    pair_count, invalid_tokens = _hex_token_stats_cached(text)
+    return pair_count, list(invalid_tokens)
+
+
+@lru_cache(maxsize=256)
+def cached_normalize_hex_text(text: str) -> str:
+    return normalize_hex_text(text)
+
+
+def hex_digest(text: str) -> str:
+    """Short content hash used to recognise hex text that already matches the skill file."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
 def hex_text_to_bytes(text: str) -> bytes:
-    """Convert canonical hex text into raw bytes."""
+    """Convert hex text already validated by ``hex_token_stats`` into raw bytes."""
+    # Canonical "0A FF" text decodes in C; anything else keeps the per-token parse.
+    # fromhex also accepts unspaced pairs ("0E7a") the token check rejects, so this
+    # is not a validator: callers must run hex_token_stats first.
+    try:
+        return bytes.fromhex(text)
+    except ValueError:
+        pass
     tokens = text.split()
     return bytes(int(token, 16) for token in tokens)
 
 
+def hex_limit_phrase(limit: int) -> str:
+    """Describe a hex length limit as shown in editor messages."""
+    if limit <= 0:
+        return "0x00 (0 values)"
+    return f"0x{limit:02X} ({limit} values)"
+
+
+@lru_cache(maxsize=8)
+def hex_edit_tooltip(can_edit: bool, limit: int, editing: bool) -> str:
+    """Return the hex view tooltip for the given editor state."""
+    if editing:
+        return (
+            f"Editing enabled. Keep length at {hex_limit_phrase(limit)}. "
+            "Use Ctrl+Z, Ctrl+C, and Ctrl+V."
+        )
+    if not can_edit:
+        return "Connect to PDUWP to enable hex editing."
+    if limit <= 0:
+        return "Skill data not available; editing disabled."
+    return f"Read-only view. Click Edit Hex to modify (must stay {hex_limit_phrase(limit)})."
+
+
 def capsule_badge_markup(capsule_type: str, fallback: str = "-") -> str:
     """Render capsule type text with themed background when available."""
     name = (capsule_type or "").strip()
@@ -442,17 +769,281 @@ def relative_offset_from_block(block: dict[str, int | str]) -> int | None:
     return None
 
 
-def skill_relative_offset_from_hex(hex_id: str) -> int | None:
-    """Calculate the relative offset for a skill based on its hex ID."""
+def skill_index_from_hex(hex_id: str) -> int:
+    """Return the skill table index for a hex ID, or -1 when it is out of range."""
+    skill_index = _SKILL_INDEX_BY_HEX.get(hex_id)
+    if skill_index is not None:
+        return skill_index
+
     try:
         skill_index = int(str(hex_id), 16)
     except (TypeError, ValueError):
-        return None
+        return -1
 
     if skill_index < 0 or skill_index >= MAX_SKILL_INDEX:
+        return -1
+    return skill_index
+
+
+def skill_relative_offset(skill_index: int) -> int:
+    """Module-relative offset of a skill block; ``skill_index`` must already be in range."""
+    return FIRST_SKILL_RELATIVE_OFFSET + _SKILL_BLOCK_OFFSETS[skill_index]
+
+
+def parse_skill_meta(meta_path: Path) -> Dict[str, Any]:
+    """Parse the flat key/value subset of YAML used by meta.yaml files."""
+    data: Dict[str, Any] = {}
+    try:
+        raw_text = meta_path.read_text(encoding="utf-8")
+    except OSError:
+        return data
+
+    for key, value in _META_LINE_RE.findall(raw_text):
+        key = key.strip()
+        value = value.strip().strip('"')
+        if not value:
+            continue
+
+        if key == "order_index":
+            try:
+                data[key] = int(value)
+            except ValueError:
+                continue
+        else:
+            data[key] = value
+
+    return data
+
+
+def _read_skill_folder(folder: Path) -> tuple[Dict[str, Any], str] | None:
+    """Read one skill folder's meta.yaml and hex dump; None when it has no usable meta."""
+    meta = parse_skill_meta(folder / "meta.yaml")
+    if not meta:
         return None
 
-    return FIRST_SKILL_RELATIVE_OFFSET + (skill_index * SKILL_BLOCK_SIZE)
+    skill_data_path = folder / "skill_data.txt"
+    try:
+        hex_dump = skill_data_path.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        hex_dump = "Skill data file not yet provided."
+    except OSError:
+        hex_dump = "Skill data file could not be read."
+    return meta, hex_dump
+
+
+def _text(value: Any, default: str = "-") -> str:
+    if value is None:
+        return default
+    text = str(value)
+    return text if text else default
+
+
+# (record key, meta key, default) for the record fields copied straight from meta.
+_RECORD_TEXT_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("school", "school", "-"),
+    ("type", "capsule_type", "-"),
+    ("cost", "cost", "-"),
+    ("strength", "strength", "-"),
+    ("uses", "uses", "-"),
+    ("range", "range", "-"),
+    ("rarity", "rarity", "Rarity ★"),
+    ("description", "description", "Official data pending."),
+    ("accuracy", "accuracy", "-"),
+    ("hit_box", "hit_box", "-"),
+    ("projectile_count", "projectile_count", "-"),
+    ("projectile_behavior", "projectile_behavior", "-"),
+    ("display_id", "display_id", "-"),
+    ("register_id", "register_id", "-"),
+    ("optional_id", "optional_id", "-"),
+)
+
+
+def load_skill_records(root: Path) -> list[dict[str, str]]:
+    """Read every skill folder under root into display records sorted by order index."""
+    try:
+        with os.scandir(root) as entries:
+            # Name order keeps the fallback order_index stable between runs.
+            folders = sorted(Path(entry.path) for entry in entries if entry.is_dir())
+    except OSError:
+        return []
+
+    # File opens dominate on Windows, so overlap them across a few threads.
+    with ThreadPoolExecutor(max_workers=SKILL_LOAD_WORKERS) as executor:
+        loaded = list(executor.map(_read_skill_folder, folders))
+
+    records: list[dict[str, str]] = []
+    for folder, folder_data in zip(folders, loaded):
+        if folder_data is None:
+            continue
+
+        meta, hex_dump = folder_data
+        skill_data_path = folder / "skill_data.txt"
+        pair_count, invalid_tokens = hex_token_stats(hex_dump)
+        hex_limit_value = str(pair_count) if pair_count and not invalid_tokens else "0"
+
+        raw_index = meta.get("order_index")
+        if isinstance(raw_index, int):
+            order_index_val = raw_index
+        else:
+            try:
+                order_index_val = int(str(raw_index))
+            except (TypeError, ValueError):
+                order_index_val = len(records)
+
+        air_allowed_value = meta.get("air_allowed")
+        if air_allowed_value is None and "area_allowed" in meta:
+            air_allowed_value = meta.get("area_allowed")
+
+        get = meta.get
+        text_fields = {key: _text(get(meta_key), default) for key, meta_key, default in _RECORD_TEXT_FIELDS}
+        record = {
+            "order_index": str(order_index_val),
+            "name": _text(get("name"), folder.name.replace("_", " ").title()),
+            "hex_id": _text(get("id_hex"), "0x0000"),
+            **text_fields,
+            "air_allowed": _text(air_allowed_value),
+            "skill_category": _text(get("skill_category"), text_fields["type"]),
+            "hex_dump": hex_dump if hex_dump else "Skill data file not yet provided.",
+            "hex_limit": hex_limit_value,
+            "folder_path": str(folder),
+            "skill_file": str(skill_data_path),
+            "baseline_hex_dump": hex_dump if pair_count and not invalid_tokens else "",
+        }
+        # Display label for live memory blocks, resolved once instead of per write.
+        record["live_label"] = record["name"] or record["hex_id"]
+        records.append(record)
+
+    records.sort(key=lambda r: int(r.get("order_index", "0")))
+    return records
+
+
+class SkillRecordLoaderSignals(QObject):
+    finished = Signal(list)
+
+
+class SkillRecordLoader(QRunnable):
+    """Read skill records on a pool thread and hand them back through a queued signal."""
+
+    def __init__(self, root: Path) -> None:
+        super().__init__()
+        self.root = root
+        self.signals = SkillRecordLoaderSignals()
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        self.signals.finished.emit(load_skill_records(self.root))
+
+
+class DebugEditorLauncherSignals(QObject):
+    launched = Signal(object)
+    failed = Signal(str)
+
+
+class DebugEditorLauncher(QRunnable):
+    """Spawn the Debug Editor on a pool thread so process creation never blocks the UI."""
+
+    def __init__(self, command: list[str]) -> None:
+        super().__init__()
+        self.command = command
+        self.signals = DebugEditorLauncherSignals()
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        try:
+            proc = subprocess.Popen(self.command, stdin=subprocess.PIPE)
+        except Exception as exc:  # noqa: BLE001
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.launched.emit(proc)
+
+
+class ProcessExitWatcherSignals(QObject):
+    exited = Signal(int)
+
+
+class ProcessExitWatcher(QRunnable):
+    """Block on a process handle off the GUI thread and report when the process ends."""
+
+    def __init__(
+        self,
+        client: WindowsMemoryEditor,
+        handle: wintypes.HANDLE,
+        stop_event: wintypes.HANDLE,
+        pid: int,
+    ) -> None:
+        super().__init__()
+        self.client = client
+        self.handle = handle
+        self.stop_event = stop_event
+        self.pid = pid
+        self.signals = ProcessExitWatcherSignals()
+        self.setAutoDelete(False)
+        self._stopped = False
+        self._closed = False
+        # stop() runs on the GUI thread; never signal an event the pool thread already closed.
+        self._lock = threading.Lock()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped = True
+            if not self._closed:
+                self.client.set_event(self.stop_event)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.client.close_handle(self.handle)
+            self.client.close_handle(self.stop_event)
+
+    def run(self) -> None:
+        try:
+            # One wait for the whole session; stop() wakes it through the stop event.
+            if self.client.wait_for_exit(self.handle, self.stop_event) and not self._stopped:
+                self.signals.exited.emit(self.pid)
+        finally:
+            self.close()
+
+
+def stock_list_label(record: dict[str, str]) -> str:
+    order_text = record.get("order_index", "0")
+    try:
+        order_value = int(order_text)
+    except ValueError:
+        order_value = 0
+    return (
+        f"{order_value + 1:03d}  {record.get('name', 'Skill'):<24}"
+        f"  {record.get('hex_id', '0x0000')}"
+    )
+
+
+class SkillListModel(QAbstractListModel):
+    """Rows of the stock browser page; the view paints only what is visible."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._records: list[dict[str, str]] = []
+        self._labels: list[str] = []
+
+    def set_records(self, records: list[dict[str, str]]) -> None:
+        self.beginResetModel()
+        self._records = records
+        self._labels = [stock_list_label(record) for record in records]
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        row = index.row()
+        if not index.isValid() or row >= len(self._records):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._records[row].get("hex_id")
+        return None
 
 
 class StockBrowserDialog(QDialog):
@@ -471,19 +1062,22 @@ class StockBrowserDialog(QDialog):
         self._build_ui()
         self._refresh_list()
 
+    def refresh(self) -> None:
+        """Return a reused dialog to its freshly opened state without rebuilding widgets."""
+        self.search_box.blockSignals(True)
+        self.search_box.clear()
+        self.search_box.blockSignals(False)
+        self.filtered_records = list(self.records)
+        self.current_page = 0
+        self._refresh_list()
+
     def _build_ui(self) -> None:
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(14, 14, 14, 14)
         root_layout.setSpacing(12)
 
         header = QFrame()
-        header.setStyleSheet(
-            "QFrame {"
-            "background-color: #2b2b2b;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        header.setStyleSheet(HEADER_FRAME_QSS)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 10, 12, 10)
         header_layout.setSpacing(12)
@@ -534,13 +1128,7 @@ class StockBrowserDialog(QDialog):
         content_layout.setSpacing(12)
 
         list_frame = QFrame()
-        list_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #262626;"
-            "border: 1px solid #333333;"
-            "border-radius: 3px;"
-            "}"
-        )
+        list_frame.setStyleSheet(PANEL_FRAME_QSS)
         list_layout = QVBoxLayout(list_frame)
         list_layout.setContentsMargins(10, 10, 10, 10)
         list_layout.setSpacing(8)
@@ -551,19 +1139,7 @@ class StockBrowserDialog(QDialog):
 
         self.page_prev = QPushButton("◄")
         self.page_prev.setFixedWidth(26)
-        self.page_prev.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 4px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        self.page_prev.setStyleSheet(PAGER_BUTTON_QSS)
         self.page_prev.clicked.connect(lambda: self._change_page(-1))
         page_header_row.addWidget(self.page_prev)
 
@@ -574,29 +1150,19 @@ class StockBrowserDialog(QDialog):
 
         self.page_next = QPushButton("►")
         self.page_next.setFixedWidth(26)
-        self.page_next.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 4px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        self.page_next.setStyleSheet(PAGER_BUTTON_QSS)
         self.page_next.clicked.connect(lambda: self._change_page(1))
         page_header_row.addWidget(self.page_next)
 
         list_layout.addLayout(page_header_row)
 
-        self.skill_list = QListWidget()
-        self.skill_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.skill_model = SkillListModel(self)
+        self.skill_list = QListView()
+        self.skill_list.setModel(self.skill_model)
+        self.skill_list.setSelectionMode(QListView.SelectionMode.SingleSelection)
         self.skill_list.setUniformItemSizes(True)
         self.skill_list.setStyleSheet(
-            "QListWidget {"
+            "QListView {"
             "background-color: #1e1e1e;"
             "color: #f0f0f0;"
             "border: 1px solid #3a3a3a;"
@@ -604,26 +1170,22 @@ class StockBrowserDialog(QDialog):
             "font-family: Consolas, 'Courier New', monospace;"
             "font-size: 12px;"
             "}"
-            "QListWidget::item {"
+            "QListView::item {"
             "padding: 4px 6px;"
             "}"
-            "QListWidget::item:selected {"
+            "QListView::item:selected {"
             "background-color: #394049;"
             "}"
         )
-        self.skill_list.currentRowChanged.connect(self._on_skill_row_changed)
+        self.skill_list.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._on_skill_row_changed(current.row())
+        )
         list_layout.addWidget(self.skill_list)
 
         content_layout.addWidget(list_frame, 2)
 
         detail_frame = QFrame()
-        detail_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #262626;"
-            "border: 1px solid #333333;"
-            "border-radius: 3px;"
-            "}"
-        )
+        detail_frame.setStyleSheet(PANEL_FRAME_QSS)
         detail_layout = QVBoxLayout(detail_frame)
         detail_layout.setContentsMargins(12, 12, 12, 12)
         detail_layout.setSpacing(10)
@@ -689,19 +1251,7 @@ class StockBrowserDialog(QDialog):
         button_row.addStretch()
 
         close_button = QPushButton("Close")
-        close_button.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 6px 14px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        close_button.setStyleSheet(DIALOG_BUTTON_QSS)
         close_button.clicked.connect(self.accept)
         button_row.addWidget(close_button)
 
@@ -740,14 +1290,15 @@ class StockBrowserDialog(QDialog):
         self._refresh_list(select_hex=previous_hex if previous_hex else None)
 
     def _refresh_list(self, select_hex: str | None = None) -> None:
-        self.skill_list.blockSignals(True)
-        self.skill_list.clear()
+        selection = self.skill_list.selectionModel()
+        selection.blockSignals(True)
 
         total_records = len(self.filtered_records)
         total_pages = max(1, (total_records + self.PAGE_SIZE - 1) // self.PAGE_SIZE) if total_records else 0
 
         if total_records == 0:
-            self.skill_list.blockSignals(False)
+            self.skill_model.set_records([])
+            selection.blockSignals(False)
             self._update_page_controls(0, 0)
             self.count_label.setText(self._count_phrase(0))
             self._show_empty_state()
@@ -766,21 +1317,8 @@ class StockBrowserDialog(QDialog):
         end_index = min(start_index + self.PAGE_SIZE, total_records)
         page_records = self.filtered_records[start_index:end_index]
 
-        for record in page_records:
-            order_text = record.get("order_index", "0")
-            try:
-                order_value = int(order_text)
-            except ValueError:
-                order_value = 0
-            display_text = (
-                f"{order_value + 1:03d}  {record.get('name', 'Skill'):<24}"
-                f"  {record.get('hex_id', '0x0000')}"
-            )
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, record.get("hex_id"))
-            self.skill_list.addItem(item)
-
-        self.skill_list.blockSignals(False)
+        self.skill_model.set_records(page_records)
+        selection.blockSignals(False)
 
         self.count_label.setText(self._count_phrase(total_records))
         self._update_page_controls(self.current_page + 1, total_pages, total_records)
@@ -793,15 +1331,14 @@ class StockBrowserDialog(QDialog):
                     break
 
         global_target_index = start_index + target_row
-        self.skill_list.setCurrentRow(target_row)
+        self.skill_list.setCurrentIndex(self.skill_model.index(target_row))
         self._display_skill(self.filtered_records[global_target_index])
 
     def _current_hex_id(self) -> str | None:
-        row = self.skill_list.currentRow()
-        if row < 0 or row >= self.skill_list.count():
+        index = self.skill_list.currentIndex()
+        if not index.isValid():
             return None
-        item = self.skill_list.item(row)
-        value = item.data(Qt.ItemDataRole.UserRole)
+        value = index.data(Qt.ItemDataRole.UserRole)
         return str(value) if value else None
 
     def _on_skill_row_changed(self, row: int) -> None:
@@ -863,7 +1400,7 @@ class SkillStatsDialog(QDialog):
         self,
         parent: QWidget,
         records: list[dict[str, str]],
-        fetch_hex: Callable[[int], str],
+        fetch_hex: Callable[..., str],
         save_callback: Callable[[int, str], bool] | None,
         revert_callback: Callable[[int], bool] | None,
         can_edit: bool,
@@ -878,8 +1415,21 @@ class SkillStatsDialog(QDialog):
         self.editing_enabled = False
         self._current_hex_limit = 0
         self._last_valid_hex_text = ""
+        # Mirror of the hex document so keystrokes don't re-materialize it.
+        self._text_cache = ""
         self._hex_guard = False
         self._limit_warning_active = False
+        self._validation_cache: dict[tuple[int, str], tuple[int, list[str]]] = {}
+        self._detail_built = False
+        pass_through = self._pass_shortcut_through
+        self._standard_key_handlers: tuple[tuple[QKeySequence.StandardKey, Callable[[], bool]], ...] = (
+            (QKeySequence.StandardKey.Paste, self._handle_paste_shortcut),
+            (QKeySequence.StandardKey.Copy, pass_through),
+            (QKeySequence.StandardKey.SelectAll, pass_through),
+            (QKeySequence.StandardKey.Undo, pass_through),
+            (QKeySequence.StandardKey.Redo, pass_through),
+            (QKeySequence.StandardKey.Cut, self._handle_cut_shortcut),
+        )
         self.current_index = max(0, min(start_index, len(self.records) - 1))
 
         self.setWindowTitle("Skill Stats")
@@ -889,19 +1439,19 @@ class SkillStatsDialog(QDialog):
         self._build_ui()
         self._apply_record()
 
+    def refresh(self, can_edit: bool) -> None:
+        """Reopen on the first record with the current connection state."""
+        self.can_edit = can_edit
+        self.current_index = 0
+        self._apply_record()
+
     def _build_ui(self) -> None:
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(14, 14, 14, 14)
         root_layout.setSpacing(12)
 
         header = QFrame()
-        header.setStyleSheet(
-            "QFrame {"
-            "background-color: #2b2b2b;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        header.setStyleSheet(HEADER_FRAME_QSS)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 10, 12, 10)
         header_layout.setSpacing(12)
@@ -929,13 +1479,7 @@ class SkillStatsDialog(QDialog):
         root_layout.addWidget(header)
 
         summary_frame = QFrame()
-        summary_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #262626;"
-            "border: 1px solid #333333;"
-            "border-radius: 3px;"
-            "}"
-        )
+        summary_frame.setStyleSheet(PANEL_FRAME_QSS)
         summary_layout = QGridLayout(summary_frame)
         summary_layout.setContentsMargins(12, 12, 12, 12)
         summary_layout.setHorizontalSpacing(24)
@@ -960,13 +1504,7 @@ class SkillStatsDialog(QDialog):
             row = index // columns
             col = index % columns
             field_frame = QFrame()
-            field_frame.setStyleSheet(
-                "QFrame {"
-                "background-color: #2e2e2e;"
-                "border: 1px solid #3b3b3b;"
-                "border-radius: 3px;"
-                "}"
-            )
+            field_frame.setStyleSheet(FIELD_FRAME_QSS)
             field_layout = QHBoxLayout(field_frame)
             field_layout.setContentsMargins(8, 6, 8, 6)
             field_layout.setSpacing(6)
@@ -983,13 +1521,7 @@ class SkillStatsDialog(QDialog):
         root_layout.addWidget(summary_frame)
 
         description_frame = QFrame()
-        description_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #262626;"
-            "border: 1px solid #333333;"
-            "border-radius: 3px;"
-            "}"
-        )
+        description_frame.setStyleSheet(PANEL_FRAME_QSS)
         description_layout = QVBoxLayout(description_frame)
         description_layout.setContentsMargins(12, 10, 12, 10)
         description_layout.setSpacing(6)
@@ -1014,19 +1546,29 @@ class SkillStatsDialog(QDialog):
             "}"
         )
 
+        # The meta/type/hex/footer frames are filled in by _build_detail_subtree
+        # once the dialog is first shown, so the summary paints before them.
         detail_container = QWidget()
-        detail_container_layout = QVBoxLayout(detail_container)
-        detail_container_layout.setContentsMargins(0, 0, 0, 0)
-        detail_container_layout.setSpacing(12)
+        self._detail_layout = QVBoxLayout(detail_container)
+        self._detail_layout.setContentsMargins(0, 0, 0, 0)
+        self._detail_layout.setSpacing(12)
+
+        detail_scroll.setWidget(detail_container)
+        root_layout.addWidget(detail_scroll)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if not self._detail_built:
+            QTimer.singleShot(0, self._build_detail_subtree)
+
+    def _build_detail_subtree(self) -> None:
+        if self._detail_built:
+            return
+
+        detail_container_layout = self._detail_layout
 
         meta_frame = QFrame()
-        meta_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #2a2a2a;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        meta_frame.setStyleSheet(SECTION_FRAME_QSS)
         meta_layout = QVBoxLayout(meta_frame)
         meta_layout.setContentsMargins(12, 10, 12, 10)
         meta_layout.setSpacing(6)
@@ -1051,13 +1593,7 @@ class SkillStatsDialog(QDialog):
         detail_container_layout.addWidget(meta_frame)
 
         type_frame = QFrame()
-        type_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #2a2a2a;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        type_frame.setStyleSheet(SECTION_FRAME_QSS)
         type_layout = QVBoxLayout(type_frame)
         type_layout.setContentsMargins(12, 10, 12, 10)
         type_layout.setSpacing(6)
@@ -1075,13 +1611,7 @@ class SkillStatsDialog(QDialog):
         detail_container_layout.addWidget(type_frame)
 
         hex_frame = QFrame()
-        hex_frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #2a2a2a;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        hex_frame.setStyleSheet(SECTION_FRAME_QSS)
         hex_layout = QVBoxLayout(hex_frame)
         hex_layout.setContentsMargins(12, 10, 12, 10)
         hex_layout.setSpacing(6)
@@ -1090,13 +1620,15 @@ class SkillStatsDialog(QDialog):
         hex_header.setStyleSheet("color: #f0f0f0; font-size: 13px; font-weight: bold;")
         hex_layout.addWidget(hex_header)
 
-        self.hex_view = QTextEdit()
+        self.hex_view = QPlainTextEdit()
         self.hex_view.setReadOnly(True)
         self.hex_view.setUndoRedoEnabled(True)
-        self.hex_view.setAcceptRichText(False)
+        self.hex_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.hex_view.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
+        # One cursor bound to the document is reused for every overwrite keystroke.
+        self._edit_cursor = QTextCursor(self.hex_view.document())
         self.hex_view.setStyleSheet(
-            "QTextEdit {"
+            "QPlainTextEdit {"
             "background-color: #1e1e1e;"
             "color: #dcdcdc;"
             "border: 1px solid #3a3a3a;"
@@ -1118,53 +1650,17 @@ class SkillStatsDialog(QDialog):
         hex_button_row.addStretch()
 
         self.refresh_button = QPushButton("Refresh From Memory")
-        self.refresh_button.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 6px 14px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        self.refresh_button.setStyleSheet(DIALOG_BUTTON_QSS)
         self.refresh_button.clicked.connect(self._refresh_from_memory)
         hex_button_row.addWidget(self.refresh_button)
 
         self.edit_button = QPushButton("Edit Hex")
-        self.edit_button.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 6px 14px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        self.edit_button.setStyleSheet(DIALOG_BUTTON_QSS)
         self.edit_button.clicked.connect(self._toggle_edit_mode)
         hex_button_row.addWidget(self.edit_button)
 
         self.revert_button = QPushButton("Revert Skill Data")
-        self.revert_button.setStyleSheet(
-            "QPushButton {"
-            "background-color: #3c3c3c;"
-            "color: #ffffff;"
-            "border: 1px solid #4a4a4a;"
-            "border-radius: 3px;"
-            "padding: 6px 14px;"
-            "font-size: 12px;"
-            "}"
-            "QPushButton:hover {"
-            "background-color: #4b4b4b;"
-            "}"
-        )
+        self.revert_button.setStyleSheet(DIALOG_BUTTON_QSS)
         self.revert_button.clicked.connect(self._handle_revert)
         hex_button_row.addWidget(self.revert_button)
 
@@ -1188,19 +1684,7 @@ class SkillStatsDialog(QDialog):
         self.back_button = QPushButton("Back to Skills Menu")
 
         for btn in (self.prev_button, self.back_button, self.next_button):
-            btn.setStyleSheet(
-                "QPushButton {"
-                "background-color: #3c3c3c;"
-                "color: #ffffff;"
-                "border: 1px solid #4a4a4a;"
-                "border-radius: 3px;"
-                "padding: 6px 14px;"
-                "font-size: 12px;"
-                "}"
-                "QPushButton:hover {"
-                "background-color: #4b4b4b;"
-                "}"
-            )
+            btn.setStyleSheet(DIALOG_BUTTON_QSS)
 
         self.prev_button.clicked.connect(lambda: self._navigate(-1))
         self.next_button.clicked.connect(lambda: self._navigate(1))
@@ -1212,18 +1696,19 @@ class SkillStatsDialog(QDialog):
 
         detail_container_layout.addWidget(footer)
 
-        detail_scroll.setWidget(detail_container)
-        root_layout.addWidget(detail_scroll)
+        self._detail_built = True
 
         # Ensure widgets start in view-only mode with accurate tooltips.
         self._set_edit_mode(False)
+        if self.records:
+            self._apply_detail_record(self.records[self.current_index])
 
     def _apply_record(self) -> None:
         if not self.records:
             return
 
         self.editing_enabled = False
-        self.hex_view.setReadOnly(True)
+        self._validation_cache.clear()
 
         record = self.records[self.current_index]
 
@@ -1251,6 +1736,12 @@ class SkillStatsDialog(QDialog):
 
         self.description_label.setText(record.get("description", "-"))
 
+        if self._detail_built:
+            self._apply_detail_record(record)
+
+    def _apply_detail_record(self, record: dict[str, str]) -> None:
+        self.hex_view.setReadOnly(True)
+
         for key, (label_text, widget) in self.meta_labels.items():
             value = record.get(key, "-")
             widget.setText(f"<strong>{html.escape(label_text)}:</strong> {html.escape(value)}")
@@ -1258,8 +1749,7 @@ class SkillStatsDialog(QDialog):
         self.skill_type_label.setText(record.get("skill_category", "Projectile"))
 
         hex_dump = self.fetch_hex(self.current_index)
-        self.hex_view.setPlainText(hex_dump)
-        self._last_valid_hex_text = self.hex_view.toPlainText()
+        self._last_valid_hex_text = self._set_hex_text(hex_dump)
 
         self._set_edit_mode(False)
 
@@ -1270,18 +1760,25 @@ class SkillStatsDialog(QDialog):
             self.hex_view.setFocus()
             return
 
-        refreshed_hex = self.fetch_hex(self.current_index)
+        refreshed_hex = self.fetch_hex(self.current_index, live=True)
         pair_count, invalid_tokens = hex_token_stats(refreshed_hex)
+        self._validation_cache.clear()
 
-        self._hex_guard = True
-        self.hex_view.setPlainText(refreshed_hex)
-        self.hex_view.moveCursor(QTextCursor.MoveOperation.Start)
-        self._hex_guard = False
-
-        self._last_valid_hex_text = refreshed_hex
+        self._last_valid_hex_text = self._set_hex_text(refreshed_hex)
         self._current_hex_limit = pair_count if pair_count and not invalid_tokens else 0
         self._set_edit_mode(False)
 
+    def _set_hex_text(
+        self, text: str, move: QTextCursor.MoveOperation = QTextCursor.MoveOperation.Start
+    ) -> str:
+        """Replace the hex document without triggering validation and resync the cache."""
+        self._hex_guard = True
+        self.hex_view.setPlainText(text)
+        self.hex_view.moveCursor(move)
+        self._hex_guard = False
+        self._text_cache = self.hex_view.toPlainText()
+        return self._text_cache
+
     def _update_navigation_buttons(self) -> None:
         total = len(self.records)
         self.prev_button.setEnabled(self.current_index > 0)
@@ -1309,11 +1806,12 @@ class SkillStatsDialog(QDialog):
         self._apply_record()
 
     def accept(self) -> None:
-        if self.editing_enabled and not self._validate_hex_length():
-            self.hex_view.setFocus()
-            return
-        self._store_current_hex()
-        self._set_edit_mode(False)
+        if self._detail_built:
+            if self.editing_enabled and not self._validate_hex_length():
+                self.hex_view.setFocus()
+                return
+            self._store_current_hex()
+            self._set_edit_mode(False)
         super().accept()
 
     def _toggle_edit_mode(self) -> None:
@@ -1330,7 +1828,7 @@ class SkillStatsDialog(QDialog):
                     "Skill data not available for editing. Provide a hex dump first.",
                 )
                 return
-            self._last_valid_hex_text = self.hex_view.toPlainText()
+            self._last_valid_hex_text = self._text_cache
             self._set_edit_mode(True)
             self.hex_view.setFocus()
             self.hex_view.moveCursor(QTextCursor.MoveOperation.End)
@@ -1347,9 +1845,8 @@ class SkillStatsDialog(QDialog):
         requested = bool(enabled and self.can_edit and self._current_hex_limit > 0)
         self.editing_enabled = requested
         self.hex_view.setReadOnly(not self.editing_enabled)
-        self.hex_view.setToolTip(
-            self._editing_tooltip() if self.editing_enabled else self._ready_tooltip()
-        )
+        tooltip = hex_edit_tooltip(self.can_edit, self._current_hex_limit, self.editing_enabled)
+        self.hex_view.setToolTip(tooltip)
 
         self.hex_view.setOverwriteMode(self.editing_enabled)
 
@@ -1357,20 +1854,19 @@ class SkillStatsDialog(QDialog):
             if self.editing_enabled:
                 self.edit_button.setEnabled(True)
                 self.edit_button.setText("Done")
-                self.edit_button.setToolTip(self._editing_tooltip())
             else:
                 can_enable = self.can_edit and self._current_hex_limit > 0
                 self.edit_button.setEnabled(can_enable)
                 self.edit_button.setText("Edit Hex")
-                self.edit_button.setToolTip(self._ready_tooltip())
+            self.edit_button.setToolTip(tooltip)
         elif not self.editing_enabled:
-            self.edit_button.setToolTip(self._ready_tooltip())
+            self.edit_button.setToolTip(tooltip)
 
     def _store_current_hex(self) -> None:
         if not self.records or not (0 <= self.current_index < len(self.records)):
             return
 
-        raw_text = self.hex_view.toPlainText()
+        raw_text = self._text_cache
         trimmed = raw_text.rstrip("\n")
         previous_hex = self.records[self.current_index].get("hex_dump", "")
         canonical = trimmed
@@ -1385,36 +1881,14 @@ class SkillStatsDialog(QDialog):
         if save_success:
             self._last_valid_hex_text = canonical
             if canonical != trimmed:
-                self._hex_guard = True
-                self.hex_view.setPlainText(canonical)
-                self.hex_view.moveCursor(QTextCursor.MoveOperation.End)
-                self._hex_guard = False
+                self._set_hex_text(canonical, QTextCursor.MoveOperation.End)
         else:
             self.records[self.current_index]["hex_dump"] = previous_hex
-            self._hex_guard = True
-            self.hex_view.setPlainText(previous_hex)
-            self.hex_view.moveCursor(QTextCursor.MoveOperation.End)
-            self._hex_guard = False
+            self._set_hex_text(previous_hex, QTextCursor.MoveOperation.End)
             self._last_valid_hex_text = previous_hex
 
     def _limit_phrase(self) -> str:
-        limit = self._current_hex_limit
-        if limit <= 0:
-            return "0x00 (0 values)"
-        return f"0x{limit:02X} ({limit} values)"
-
-    def _editing_tooltip(self) -> str:
-        return (
-            f"Editing enabled. Keep length at {self._limit_phrase()}. "
-            "Use Ctrl+Z, Ctrl+C, and Ctrl+V."
-        )
-
-    def _ready_tooltip(self) -> str:
-        if not self.can_edit:
-            return "Connect to PDUWP to enable hex editing."
-        if self._current_hex_limit <= 0:
-            return "Skill data not available; editing disabled."
-        return f"Read-only view. Click Edit Hex to modify (must stay {self._limit_phrase()})."
+        return hex_limit_phrase(self._current_hex_limit)
 
     def _show_limit_warning(self, message: str) -> None:
         if self._limit_warning_active:
@@ -1428,7 +1902,9 @@ class SkillStatsDialog(QDialog):
             self._show_limit_warning("No hex data available yet; nothing to overwrite.")
             return
 
-        text = self.hex_view.toPlainText()
+        text = self._text_cache
+        if self.hex_view.document().characterCount() - 1 != len(text):
+            text = self._text_cache = self.hex_view.toPlainText()
         if not text:
             return
 
@@ -1436,29 +1912,32 @@ class SkillStatsDialog(QDialog):
         position = cursor.selectionStart() if cursor.hasSelection() else cursor.position()
         position = max(0, min(position, len(text) - 1))
 
-        while position < len(text) and text[position] not in HEX_DIGITS:
+        text_length = len(text)
+        while position < text_length and text[position] not in HEX_DIGITS:
             position += 1
 
-        if position >= len(text):
+        if position >= text_length:
             self._show_limit_warning("Move the cursor onto a hex value before typing.")
             return
 
-        replace_cursor = self.hex_view.textCursor()
-        replace_cursor.setPosition(position)
-        replace_cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor)
+        edit_cursor = self._edit_cursor
+        edit_cursor.setPosition(position)
+        edit_cursor.movePosition(QTextCursor.MoveOperation.Right, QTextCursor.MoveMode.KeepAnchor)
 
+        value = char.upper()
         self._hex_guard = True
-        replace_cursor.insertText(char.upper())
+        edit_cursor.insertText(value)
         self._hex_guard = False
 
-        updated_text = self.hex_view.toPlainText()
+        # A single character was overwritten in place, so patch the mirror directly.
+        updated_text = self._text_cache = text[:position] + value + text[position + 1 :]
         next_position = position + 1
-        while next_position < len(updated_text) and updated_text[next_position] not in HEX_DIGITS:
+        updated_length = len(updated_text)
+        while next_position < updated_length and updated_text[next_position] not in HEX_DIGITS:
             next_position += 1
 
-        next_cursor = self.hex_view.textCursor()
-        next_cursor.setPosition(min(next_position, len(updated_text)))
-        self.hex_view.setTextCursor(next_cursor)
+        edit_cursor.setPosition(min(next_position, updated_length))
+        self.hex_view.setTextCursor(edit_cursor)
 
         self._last_valid_hex_text = updated_text
 
@@ -1466,7 +1945,8 @@ class SkillStatsDialog(QDialog):
         if self._hex_guard:
             return
 
-        text = self.hex_view.toPlainText()
+        # Unguarded edits (undo, redo, drops) can reshape the text, so read it back.
+        text = self._text_cache = self.hex_view.toPlainText()
 
         if not self.editing_enabled:
             self._last_valid_hex_text = text
@@ -1479,10 +1959,7 @@ class SkillStatsDialog(QDialog):
         pair_count, invalid_tokens = hex_token_stats(text)
 
         if invalid_tokens or pair_count != self._current_hex_limit:
-            self._hex_guard = True
-            self.hex_view.setPlainText(self._last_valid_hex_text)
-            self.hex_view.moveCursor(QTextCursor.MoveOperation.Start)
-            self._hex_guard = False
+            self._set_hex_text(self._last_valid_hex_text)
 
             if invalid_tokens:
                 preview = ", ".join(invalid_tokens[:3])
@@ -1529,44 +2006,23 @@ class SkillStatsDialog(QDialog):
             return
 
         formatted = normalize_hex_text(sanitized)
-
-        self._hex_guard = True
-        self.hex_view.setPlainText(formatted)
-        self.hex_view.moveCursor(QTextCursor.MoveOperation.Start)
-        self._hex_guard = False
-
-        self._last_valid_hex_text = formatted
+        self._last_valid_hex_text = self._set_hex_text(formatted)
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         if obj is self.hex_view:
             if self.editing_enabled:
                 if event.type() == QEvent.Type.KeyPress:
                     key_event = cast(QKeyEvent, event)
+                    key = key_event.key()
 
-                    if key_event.matches(QKeySequence.StandardKey.Paste):
-                        self._perform_overwrite_paste()
-                        return True
-
-                    if (
-                        key_event.matches(QKeySequence.StandardKey.Copy)
-                        or key_event.matches(QKeySequence.StandardKey.SelectAll)
-                        or key_event.matches(QKeySequence.StandardKey.Undo)
-                        or key_event.matches(QKeySequence.StandardKey.Redo)
-                    ):
-                        return False
-
-                    if key_event.matches(QKeySequence.StandardKey.Cut):
-                        self._show_limit_warning("Cut is disabled; paste over existing bytes instead.")
-                        return True
+                    # Plain typing never matches a standard shortcut, so only
+                    # consult Qt's shortcut tables for chords and dedicated keys.
+                    if key_event.modifiers() & _SHORTCUT_MODIFIERS or key in _UNMODIFIED_SHORTCUT_KEYS:
+                        for standard_key, handler in self._standard_key_handlers:
+                            if key_event.matches(standard_key):
+                                return handler()
 
-                    blocked_keys = {
-                        Qt.Key.Key_Backspace,
-                        Qt.Key.Key_Delete,
-                        Qt.Key.Key_Return,
-                        Qt.Key.Key_Enter,
-                        Qt.Key.Key_Tab,
-                    }
-                    if key_event.key() in blocked_keys:
+                    if key in _BLOCKED_HEX_EDIT_KEYS:
                         self._show_limit_warning(
                             "Hex edits preserve size. Use Ctrl+V to overwrite with prepared bytes."
                         )
@@ -1590,12 +2046,23 @@ class SkillStatsDialog(QDialog):
 
         return super().eventFilter(obj, event)
 
+    def _pass_shortcut_through(self) -> bool:
+        return False
+
+    def _handle_paste_shortcut(self) -> bool:
+        self._perform_overwrite_paste()
+        return True
+
+    def _handle_cut_shortcut(self) -> bool:
+        self._show_limit_warning("Cut is disabled; paste over existing bytes instead.")
+        return True
+
     def _validate_hex_length(self, *, show_message: bool = True) -> bool:
         if self._current_hex_limit <= 0:
             return True
 
-        text = self.hex_view.toPlainText()
-        pair_count, invalid_tokens = hex_token_stats(text)
+        text = self._text_cache
+        pair_count, invalid_tokens = self._cached_hex_stats(text)
 
         if invalid_tokens:
             if show_message:
@@ -1625,7 +2092,31 @@ class SkillStatsDialog(QDialog):
         self._last_valid_hex_text = text
         return True
 
-MAP_SUMMARY = [
+    def _cached_hex_stats(self, text: str) -> tuple[int, list[str]]:
+        """Reuse the last tokenization of unchanged text for the current skill."""
+        key = (self.current_index, text)
+        cached = self._validation_cache.get(key)
+        if cached is None:
+            cached = hex_token_stats(text)
+            if len(self._validation_cache) >= VALIDATION_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry.
+                del self._validation_cache[next(iter(self._validation_cache))]
+            self._validation_cache[key] = cached
+        return cached
+
+class MapRow(NamedTuple):
+    map: str
+    map_name: str
+    internal: str
+    id: str
+
+
+class CharacterRow(NamedTuple):
+    name: str
+    id: str
+
+
+MAP_SUMMARY = (
     (
         "Debug Stage",
         "Developer testing arena surfaced by debug mode, stocked with Attack, Defense, Special, Erase, Status, Environmental, and Aura Particle capsules.",
@@ -1658,94 +2149,282 @@ MAP_SUMMARY = [
         "Sein",
         "Floating island dominated by a colossal, ever-growing broken tower at its center.",
     ),
-]
+)
 
-MAP_INDEX = [
-    {"map": "Debug Stage", "map_name": "Debug Stage", "internal": "DUMMY", "id": "st00"},
-    {"map": "Edgar's Dream", "map_name": "Edgar's Dream", "internal": "LD_InsideofRuin", "id": "st01"},
-    {"map": "Highway", "map_name": "Spiral Highway", "internal": "Highway-evening", "id": "st02"},
-    {"map": "Palace", "map_name": "Lost Palace", "internal": "Palace-blue", "id": "st03"},
-    {"map": "Panorama", "map_name": "Panorama Earthquake", "internal": "Panorama-earth", "id": "st04"},
-    {"map": "Strange City", "map_name": "Dawn City", "internal": "City-orenge", "id": "st05"},
-    {"map": "Refinery", "map_name": "Storm Refinery", "internal": "Plant-blue", "id": "st06"},
-    {"map": "Lane", "map_name": "Twilight Lane", "internal": "TownofMemory", "id": "st07"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Ruin", "id": "st08"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st09"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st10"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st11"},
-    {"map": "Highway", "map_name": "Lightning Highway", "internal": "Highway-thunder", "id": "st12"},
-    {"map": "Palace", "map_name": "Light Palace", "internal": "Palace-yellow", "id": "st13"},
-    {"map": "Panorama", "map_name": "Panorama Building", "internal": "Panorama-fog", "id": "st14"},
-    {"map": "Strange City", "map_name": "Dusk City", "internal": "City-gray", "id": "st15"},
-    {"map": "Refinery", "map_name": "Sunset Refinery", "internal": "Plant-yellow", "id": "st16"},
-    {"map": "Lane", "map_name": "Silent Lane", "internal": "TownofMemory-blue", "id": "st17"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st18"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st19"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st20"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st21"},
-    {"map": "Highway", "map_name": "Sunlight Highway", "internal": "Highway-summer", "id": "st22"},
-    {"map": "Palace", "map_name": "Noble Palace", "internal": "Palace-red", "id": "st23"},
-    {"map": "Panorama", "map_name": "Panorama Boss", "internal": "Panorama-boss", "id": "st24"},
-    {"map": "Strange City", "map_name": "Midnight City", "internal": "City-blue", "id": "st25"},
-    {"map": "Refinery", "map_name": "Acid Refinery", "internal": "Plant-darkblue", "id": "st26"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st27"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st28"},
-    {"map": "Dummy", "map_name": "Dummy", "internal": "Dummy", "id": "st29"},
-]
+MAP_INDEX = (
+    MapRow("Debug Stage", "Debug Stage", "DUMMY", "st00"),
+    MapRow("Edgar's Dream", "Edgar's Dream", "LD_InsideofRuin", "st01"),
+    MapRow("Highway", "Spiral Highway", "Highway-evening", "st02"),
+    MapRow("Palace", "Lost Palace", "Palace-blue", "st03"),
+    MapRow("Panorama", "Panorama Earthquake", "Panorama-earth", "st04"),
+    MapRow("Strange City", "Dawn City", "City-orenge", "st05"),
+    MapRow("Refinery", "Storm Refinery", "Plant-blue", "st06"),
+    MapRow("Lane", "Twilight Lane", "TownofMemory", "st07"),
+    MapRow("Dummy", "Dummy", "Ruin", "st08"),
+    MapRow("Dummy", "Dummy", "Dummy", "st09"),
+    MapRow("Dummy", "Dummy", "Dummy", "st10"),
+    MapRow("Dummy", "Dummy", "Dummy", "st11"),
+    MapRow("Highway", "Lightning Highway", "Highway-thunder", "st12"),
+    MapRow("Palace", "Light Palace", "Palace-yellow", "st13"),
+    MapRow("Panorama", "Panorama Building", "Panorama-fog", "st14"),
+    MapRow("Strange City", "Dusk City", "City-gray", "st15"),
+    MapRow("Refinery", "Sunset Refinery", "Plant-yellow", "st16"),
+    MapRow("Lane", "Silent Lane", "TownofMemory-blue", "st17"),
+    MapRow("Dummy", "Dummy", "Dummy", "st18"),
+    MapRow("Dummy", "Dummy", "Dummy", "st19"),
+    MapRow("Dummy", "Dummy", "Dummy", "st20"),
+    MapRow("Dummy", "Dummy", "Dummy", "st21"),
+    MapRow("Highway", "Sunlight Highway", "Highway-summer", "st22"),
+    MapRow("Palace", "Noble Palace", "Palace-red", "st23"),
+    MapRow("Panorama", "Panorama Boss", "Panorama-boss", "st24"),
+    MapRow("Strange City", "Midnight City", "City-blue", "st25"),
+    MapRow("Refinery", "Acid Refinery", "Plant-darkblue", "st26"),
+    MapRow("Dummy", "Dummy", "Dummy", "st27"),
+    MapRow("Dummy", "Dummy", "Dummy", "st28"),
+    MapRow("Dummy", "Dummy", "Dummy", "st29"),
+)
+
+PLAYABLE_CHARACTERS = (
+    CharacterRow("Alpha (underground model)", "evpc00a"),
+    CharacterRow("Alpha (gameplay model)", "pc00a"),
+    CharacterRow("Edgar", "pc01a"),
+    CharacterRow("Freia", "pc02a"),
+    CharacterRow("Meister", "pc03a"),
+    CharacterRow("Chunky", "pc04a"),
+    CharacterRow("Cuff Button", "pc05a"),
+    CharacterRow("pH", "pc06a"),
+    CharacterRow("Know", "pc07a"),
+    CharacterRow("Tsubutaki", "pc08a"),
+    CharacterRow("JD", "pc09a"),
+    CharacterRow("Sammah", "pc10a"),
+)
+
+NPC_CHARACTERS = (
+    CharacterRow("Leader", "npc00a"),
+    CharacterRow("03", "npc01a"),
+    CharacterRow("Spokesman", "npc02a"),
+    CharacterRow("Ubiquitous", "npc03a"),
+    CharacterRow("Kajikawa", "npc04a"),
+    CharacterRow("Tetsuya", "npc05a"),
+    CharacterRow("Arthur", "npc06a"),
+    CharacterRow("Reindeer", "npc07a"),
+    CharacterRow("Mac", "npc08a"),
+    CharacterRow("Baroness", "npc09a"),
+    CharacterRow("Mikan", "npc10a"),
+    CharacterRow("Ai", "npc11a"),
+    CharacterRow("Maniac", "npc12a"),
+    CharacterRow("Kei", "npc13a"),
+)
+
+ENEMY_CHARACTERS = (
+    CharacterRow("Ommato", "enm00a"),
+    CharacterRow("Scoto", "enm01a"),
+    CharacterRow("Claustro", "enm02a"),
+    CharacterRow("Catoptro", "enm03a"),
+    CharacterRow("Mechano", "enm04a"),
+    CharacterRow("Gyne", "enm05a"),
+    CharacterRow("Euroto", "enm06a"),
+    CharacterRow("Hedono", "enm07a"),
+    CharacterRow("Anthro", "enm08a"),
+    CharacterRow("Andro", "enm09a"),
+    CharacterRow("Vestio", "enm10a"),
+    CharacterRow("Partheno", "enm11a"),
+    CharacterRow("Guard", "enm12a"),
+    CharacterRow("Ceno", "enm13a"),
+    CharacterRow("Germano", "enm14a"),
+    CharacterRow("Belono", "enm15a"),
+)
+
+# HTML-escaped copies of the static index data, prepared once at import.
+_MAP_SUMMARY_ESCAPED = tuple((html.escape(name), html.escape(text)) for name, text in MAP_SUMMARY)
+_MAP_INDEX_ESCAPED = tuple(MapRow._make(map(html.escape, entry)) for entry in MAP_INDEX)
+_PLAYABLE_CHARACTERS_ESCAPED = tuple(CharacterRow._make(map(html.escape, entry)) for entry in PLAYABLE_CHARACTERS)
+_NPC_CHARACTERS_ESCAPED = tuple(CharacterRow._make(map(html.escape, entry)) for entry in NPC_CHARACTERS)
+_ENEMY_CHARACTERS_ESCAPED = tuple(CharacterRow._make(map(html.escape, entry)) for entry in ENEMY_CHARACTERS)
+
+# Row templates for the index tables, parsed once instead of per-row f-strings.
+_MAP_ROW = (
+    "<tr>"
+    "<td style='padding:4px 8px;'>{map}</td>"
+    "<td style='padding:4px 8px;'>{map_name}</td>"
+    "<td style='padding:4px 8px;'>{internal}</td>"
+    "<td style='padding:4px 8px;'>{id}</td>"
+    "</tr>"
+).format
+_CHARACTER_ROW = (
+    "<tr>"
+    "<td style='padding:4px 8px;'>{name}</td>"
+    "<td style='padding:4px 8px;'>{id}</td>"
+    "</tr>"
+).format
+
+
+# The index tables are static, so each HTML block is built once per process.
+@lru_cache(maxsize=None)
+def map_summary_html() -> str:
+    items = "".join(
+        f"<li><strong>{name}</strong>: {description}</li>"
+        for name, description in _MAP_SUMMARY_ESCAPED
+    )
+    return f"<p style='margin:0 0 6px 0;'>Key locale notes:</p><ul style='margin:0 0 8px 16px;'>{items}</ul>"
+
+
+@lru_cache(maxsize=None)
+def map_table_html() -> str:
+    header = (
+        "<tr>"
+        "<th style='text-align:left;padding:4px 8px;'>Map</th>"
+        "<th style='text-align:left;padding:4px 8px;'>Map Name</th>"
+        "<th style='text-align:left;padding:4px 8px;'>Internal Name</th>"
+        "<th style='text-align:left;padding:4px 8px;'>ID</th>"
+        "</tr>"
+    )
+    rows = "".join(
+        _MAP_ROW(map=entry.map, map_name=entry.map_name, internal=entry.internal, id=entry.id)
+        for entry in _MAP_INDEX_ESCAPED
+    )
+    return (
+        "<table style='border-collapse:collapse;width:100%;'>"
+        f"<thead style='background-color:#333333;color:#ffffff;'>{header}</thead>"
+        f"<tbody>{rows}</tbody></table>"
+    )
+
+
+@lru_cache(maxsize=None)
+def character_table_html(title: str, rows: tuple[CharacterRow, ...]) -> str:
+    """Render one character table; rows must already be HTML-escaped."""
+    header = (
+        "<tr>"
+        "<th style='text-align:left;padding:4px 8px;'>Name</th>"
+        "<th style='text-align:left;padding:4px 8px;'>ID</th>"
+        "</tr>"
+    )
+    body = "".join(_CHARACTER_ROW(name=entry.name, id=entry.id) for entry in rows)
+    return (
+        f"<h4 style='margin:0 0 4px 0;color:#f0f0f0;font-size:13px;'>{html.escape(title)}</h4>"
+        "<table style='border-collapse:collapse;width:100%;margin-bottom:6px;'>"
+        f"<thead style='background-color:#333333;color:#ffffff;'>{header}</thead>"
+        f"<tbody>{body}</tbody></table>"
+    )
+
+
+def _resolve_editor_python() -> Path:
+    """Interpreter for the Debug Editor: a console python.exe next to the running one."""
+    python_exe = Path(sys.executable)
+    if python_exe.name.lower() != "python.exe":
+        candidate = Path(sys.base_prefix) / "python.exe"
+        if candidate.exists():
+            python_exe = candidate
+        else:
+            python_exe = Path("python")
+    return python_exe
+
+
+class IntroTypewriter(QWidget):
+    """Plain-text intro that reveals prebuilt, pre-shaped prefixes one frame at a time."""
+
+    def __init__(self, full_text: str, chars_per_frame: int, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._full_text = full_text
+        self._text_color = QColor(VS_TEXT)
+        self._texts = [
+            full_text[:end]
+            for end in range(chars_per_frame, len(full_text) + chars_per_frame, chars_per_frame)
+        ]
+        self._prefixes: list[QStaticText] = []
+        self._prepared_width = -1
+        self._index = -1
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+
+    def frame_count(self) -> int:
+        return len(self._texts)
+
+    def set_frame(self, index: int) -> None:
+        self._index = index
+        self.update()
+
+    def set_final_text(self, text: str) -> None:
+        """Replace the frames with one static line (used once the intro has faded)."""
+        self._full_text = text
+        self._texts = [text]
+        self._prefixes = []
+        self._prepared_width = -1
+        self._index = 0
+        self.updateGeometry()
+        self.update()
+
+    def _prepare(self) -> None:
+        # Shaping and line breaking happen once per width, not once per tick.
+        width = self.width()
+        if width == self._prepared_width:
+            return
+        self._prepared_width = width
+        font = self.font()
+        self._prefixes = []
+        for text in self._texts:
+            # Plain-text QStaticText ignores "\n"; a Unicode line separator keeps the breaks.
+            static = QStaticText(text.replace("\n", "\u2028"))
+            static.setTextFormat(Qt.TextFormat.PlainText)
+            static.setTextWidth(width)
+            static.prepare(QTransform(), font)
+            self._prefixes.append(static)
+
+    def hasHeightForWidth(self) -> bool:
+        return True
 
-PLAYABLE_CHARACTERS = [
-    {"name": "Alpha (underground model)", "id": "evpc00a"},
-    {"name": "Alpha (gameplay model)", "id": "pc00a"},
-    {"name": "Edgar", "id": "pc01a"},
-    {"name": "Freia", "id": "pc02a"},
-    {"name": "Meister", "id": "pc03a"},
-    {"name": "Chunky", "id": "pc04a"},
-    {"name": "Cuff Button", "id": "pc05a"},
-    {"name": "pH", "id": "pc06a"},
-    {"name": "Know", "id": "pc07a"},
-    {"name": "Tsubutaki", "id": "pc08a"},
-    {"name": "JD", "id": "pc09a"},
-    {"name": "Sammah", "id": "pc10a"},
-]
+    def heightForWidth(self, width: int) -> int:
+        # Reserve the full paragraph up front so the layout never shifts while typing.
+        return self.fontMetrics().boundingRect(
+            0, 0, width, 1 << 16, Qt.TextFlag.TextWordWrap, self._full_text
+        ).height()
 
-NPC_CHARACTERS = [
-    {"name": "Leader", "id": "npc00a"},
-    {"name": "03", "id": "npc01a"},
-    {"name": "Spokesman", "id": "npc02a"},
-    {"name": "Ubiquitous", "id": "npc03a"},
-    {"name": "Kajikawa", "id": "npc04a"},
-    {"name": "Tetsuya", "id": "npc05a"},
-    {"name": "Arthur", "id": "npc06a"},
-    {"name": "Reindeer", "id": "npc07a"},
-    {"name": "Mac", "id": "npc08a"},
-    {"name": "Baroness", "id": "npc09a"},
-    {"name": "Mikan", "id": "npc10a"},
-    {"name": "Ai", "id": "npc11a"},
-    {"name": "Maniac", "id": "npc12a"},
-    {"name": "Kei", "id": "npc13a"},
-]
+    def sizeHint(self) -> QSize:
+        return QSize(400, self.heightForWidth(400))
 
-ENEMY_CHARACTERS = [
-    {"name": "Ommato", "id": "enm00a"},
-    {"name": "Scoto", "id": "enm01a"},
-    {"name": "Claustro", "id": "enm02a"},
-    {"name": "Catoptro", "id": "enm03a"},
-    {"name": "Mechano", "id": "enm04a"},
-    {"name": "Gyne", "id": "enm05a"},
-    {"name": "Euroto", "id": "enm06a"},
-    {"name": "Hedono", "id": "enm07a"},
-    {"name": "Anthro", "id": "enm08a"},
-    {"name": "Andro", "id": "enm09a"},
-    {"name": "Vestio", "id": "enm10a"},
-    {"name": "Partheno", "id": "enm11a"},
-    {"name": "Guard", "id": "enm12a"},
-    {"name": "Ceno", "id": "enm13a"},
-    {"name": "Germano", "id": "enm14a"},
-    {"name": "Belono", "id": "enm15a"},
-]
+    def paintEvent(self, event) -> None:
+        if self._index < 0 or not self._texts:
+            return
+        self._prepare()
+        painter = QPainter(self)
+        painter.setPen(self._text_color)
+        painter.drawStaticText(0, 0, self._prefixes[min(self._index, len(self._prefixes) - 1)])
 
 
 class MainWindow(QMainWindow):
+    _BTN_STYLE_CONNECTED = (
+        "QPushButton {"
+        "background-color: #16825d;"
+        "color: #ffffff;"
+        "border: 1px solid #0e5c40;"
+        "border-radius: 2px;"
+        "padding: 0 6px;"
+        "font-size: 11px;"
+        "}"
+        "QPushButton:hover {"
+        "background-color: #1ea06f;"
+        "}"
+    )
+    _BTN_STYLE_DISCONNECTED = (
+        "QPushButton {"
+        "background-color: #b22222;"
+        "color: #ffffff;"
+        "border: 1px solid #7f1515;"
+        "border-radius: 2px;"
+        "padding: 0 6px;"
+        "font-size: 11px;"
+        "}"
+        "QPushButton:hover {"
+        "background-color: #d62828;"
+        "}"
+    )
+    _BLINK_STYLES = (_blink_button_qss("#f1c232"), _blink_button_qss("#ffd966"))
+    # Section toggle styles keyed by (expanded, highlighted).
+    _MENU_BUTTON_STYLES = {
+        (expanded, highlighted): _menu_button_qss(expanded, highlighted)
+        for expanded in (False, True)
+        for highlighted in (False, True)
+    }
+
     def __init__(self):
         super().__init__()
 
@@ -1754,8 +2433,36 @@ class MainWindow(QMainWindow):
 
         # Track connection state
         self.connected = False
+        # PID the status widgets were last rendered for; -1 forces the first update.
+        self._last_pid: int | None = -1
+        self._exit_watcher: ProcessExitWatcher | None = None
+        # The exit wait parks a thread for the whole session, so it gets its own pool.
+        self._exit_watch_pool = QThreadPool(self)
+        self._exit_watch_pool.setMaxThreadCount(1)
+        self._editor_proc: subprocess.Popen[bytes] | None = None
+        self._editor_launcher: DebugEditorLauncher | None = None
+        self._editor_launching = False
+        # Dialogs are built on first open and reused while skill_records stays the same list.
+        self._stock_dialog: StockBrowserDialog | None = None
+        self._skill_stats_dialog: SkillStatsDialog | None = None
+        # Launch target for the Debug Editor, resolved once instead of per click.
+        self._editor_entry = Path(sys.argv[0]).resolve().parent / "data" / "stageset" / "stageset_editor.py"
+        self._editor_entry_exists = self._editor_entry.exists()
+        self._editor_python = _resolve_editor_python()
+        # Latest memory status text waiting for the next event-loop pass.
+        self._pending_memory_status: str | None = None
         self.memory_client = WindowsMemoryEditor()
         self._skill_table_base: int | None = None
+        # Module base of the current attach, cached for absolute -> relative offsets.
+        self._module_base: int | None = None
+        # Resolved skill blocks by hex id, tagged with the table version they were
+        # resolved under; bumping the version on reset invalidates all of them at once.
+        self._skill_table_version = 0
+        self._live_block_cache: dict[str, tuple[int, dict[str, int | str]]] = {}
+        # Snapshot of skill blocks taken when the skill stats dialog opens, keyed by address.
+        # It serves the whole session; the session's own reads and writes update it, so a
+        # record never mixes snapshot bytes with later live bytes.
+        self._live_prefetch: dict[int, bytes] = {}
 
         # Root widget
         central = QWidget()
@@ -1768,7 +2475,7 @@ class MainWindow(QMainWindow):
         # Left activity bar (like VS Code icons bar)
         self.activity_bar = QFrame()
         self.activity_bar.setFixedWidth(48)
-        self.activity_bar.setStyleSheet(f"background-color: {VS_SIDEBAR};")
+        _apply_fill(self.activity_bar, VS_SIDEBAR)
         root_layout.addWidget(self.activity_bar)
 
         # Main column: top tab bar, middle editor, bottom status
@@ -1780,13 +2487,12 @@ class MainWindow(QMainWindow):
         # Top "tab" bar
         self.tab_bar = QFrame()
         self.tab_bar.setFixedHeight(32)
-        self.tab_bar.setStyleSheet(f"background-color: {VS_TABBAR};")
+        _apply_fill(self.tab_bar, VS_TABBAR, VS_TEXT)
         tab_layout = QHBoxLayout(self.tab_bar)
         tab_layout.setContentsMargins(8, 0, 0, 0)
         tab_layout.setSpacing(16)
 
         self.tab_label = QLabel("Awaiting for PDUWP Connection.")
-        self.tab_label.setStyleSheet(f"color: {VS_TEXT};")
         tab_layout.addWidget(self.tab_label)
         tab_layout.addStretch()
 
@@ -1803,14 +2509,6 @@ class MainWindow(QMainWindow):
         title.setStyleSheet("color: #ffffff; font-size: 18px;")
         editor_layout.addWidget(title)
 
-        self.intro_label = QLabel("")
-        self.intro_label.setStyleSheet(f"color: {VS_TEXT};")
-        self.intro_label.setWordWrap(True)
-        self.intro_opacity_effect = QGraphicsOpacityEffect(self.intro_label)
-        self.intro_label.setGraphicsEffect(self.intro_opacity_effect)
-        self.intro_opacity_effect.setOpacity(1.0)
-        editor_layout.addWidget(self.intro_label)
-
         self.intro_full_text = (
             "Welcome to the BBMODS control surface for Edgar's Dream World.\n"
             "This demo build is a stand-in while the official program is being developed, showcasing the workflow to come.\n"
@@ -1818,12 +2516,25 @@ class MainWindow(QMainWindow):
             "When connected, expand a menu label to reveal its tools; only one section stays open at a time for clarity.\n"
             "Use the status footer to trigger manual connection checks and watch for live feedback on session state."
         )
-        self.intro_display_index = 0
+        self.intro_label = IntroTypewriter(self.intro_full_text, INTRO_CHARS_PER_TICK)
+        self.intro_opacity_effect = QGraphicsOpacityEffect(self.intro_label)
+        self.intro_label.setGraphicsEffect(self.intro_opacity_effect)
+        self.intro_opacity_effect.setOpacity(1.0)
+        editor_layout.addWidget(self.intro_label)
+
+        # Frame currently on screen; frames follow the clock, not the tick count.
+        self.intro_display_index = -1
         self.intro_timer = QTimer(self)
-        self.intro_timer.setInterval(35)
+        self.intro_timer.setInterval(INTRO_TICK_MS)
         self.intro_timer.timeout.connect(self._advance_intro_text)
+        self._intro_started = time.monotonic()
         self.intro_timer.start()
-        self.intro_fade_animation: QPropertyAnimation | None = None
+        self.intro_fade_animation = QPropertyAnimation(self.intro_opacity_effect, b"opacity", self)
+        self.intro_fade_animation.setDuration(1500)
+        self.intro_fade_animation.setStartValue(1.0)
+        self.intro_fade_animation.setEndValue(0.0)
+        self.intro_fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self.intro_fade_animation.finished.connect(self._on_intro_fade_finished)
 
         self.menu_panel = QFrame()
         self.menu_panel.setStyleSheet(
@@ -1840,16 +2551,33 @@ class MainWindow(QMainWindow):
 
         self.menu_sections: Dict[str, Dict[str, Any]] = {}
         self.active_menu: str | None = None
-        self.skill_records = self._load_skill_records()
-        self._blink_timers: List[QTimer] = []
+        # (active section, panel shown) as last applied by _apply_menu_state.
+        self._last_menu_state: tuple[str | None, bool] | None = None
+        # Skill folders are read on first use (opening Skills or a skill dialog).
+        self._skill_records: list[dict[str, str]] | None = None
+        self._skill_records_empty = True
+        self._skill_index_by_hex: dict[str, int] = {}
+        self._message_boxes: dict[tuple[QMessageBox.Icon, str, str], QMessageBox] = {}
+        self._skill_loader: SkillRecordLoader | None = None
+        # Every slow-blinking button shares one timer and one on/off phase.
+        self._blink_targets: list[tuple[QPushButton, tuple[str, str]]] = []
+        self._blink_phase = 0
+        self._master_blink_timer = QTimer(self)
+        self._master_blink_timer.setInterval(1200)
+        self._master_blink_timer.timeout.connect(self._tick_blinks)
+        # Warning flashes do the same on their own 1300 ms beat.
+        self._flash_targets: list[tuple[QLabel, tuple[str, str]]] = []
+        self._flash_phase = 0
+        self._master_flash_timer = QTimer(self)
+        self._master_flash_timer.setInterval(1300)
+        self._master_flash_timer.timeout.connect(self._tick_flashes)
 
         for name in ("Skills", "Maps", "Characters", "Menus", "Audio", "Campaign"):
             section = self._build_menu_section(name)
             menu_layout.addWidget(section["wrapper"])
+            section["parent_layout"] = menu_layout
             self.menu_sections[name] = section
 
-        self._initialize_menu_content()
-
         self.menu_panel.setVisible(False)
         editor_layout.addWidget(self.menu_panel)
 
@@ -1859,17 +2587,17 @@ class MainWindow(QMainWindow):
         # Bottom status bar
         self.status_bar = QFrame()
         self.status_bar.setFixedHeight(24)
-        self.status_bar.setStyleSheet("background-color: #007acc;")
+        _apply_fill(self.status_bar, "#007acc", "#ffffff")
         status_layout = QHBoxLayout(self.status_bar)
         status_layout.setContentsMargins(8, 0, 8, 0)
         status_layout.setSpacing(12)
 
         self.status_label = QLabel("PDUWP: Not Connected")
-        self.status_label.setStyleSheet("color: #ffffff; font-size: 11px;")
+        self.status_label.setFont(_status_font())
         status_layout.addWidget(self.status_label)
 
         self.memory_label = QLabel("Memory: idle")
-        self.memory_label.setStyleSheet("color: #ffffff; font-size: 11px;")
+        self.memory_label.setFont(_status_font())
         status_layout.addWidget(self.memory_label)
 
         status_layout.addStretch()
@@ -1882,51 +2610,50 @@ class MainWindow(QMainWindow):
 
         main_column.addWidget(self.status_bar)
 
-        # Timer to auto check process every 2 seconds
+        # Timer to auto check process every 2 seconds (slow fallback while an exit watch runs)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.check_pduwp_process)
-        self.timer.start(2000)
 
+        # Menu contents and the first process sweep wait until the window has been shown.
+        QTimer.singleShot(0, self._finish_init)
+
+    def _finish_init(self) -> None:
+        self._initialize_menu_content()
+        self.timer.start(PROCESS_POLL_MS)
         # Initial check
         self.check_pduwp_process()
 
     def _button_style(self, connected: bool) -> str:
-        if connected:
-            return (
-                "QPushButton {"
-                "background-color: #16825d;"
-                "color: #ffffff;"
-                "border: 1px solid #0e5c40;"
-                "border-radius: 2px;"
-                "padding: 0 6px;"
-                "font-size: 11px;"
-                "}"
-                "QPushButton:hover {"
-                "background-color: #1ea06f;"
-                "}"
-            )
-        else:
-            return (
-                "QPushButton {"
-                "background-color: #b22222;"
-                "color: #ffffff;"
-                "border: 1px solid #7f1515;"
-                "border-radius: 2px;"
-                "padding: 0 6px;"
-                "font-size: 11px;"
-                "}"
-                "QPushButton:hover {"
-                "background-color: #d62828;"
-                "}"
-            )
+        return self._BTN_STYLE_CONNECTED if connected else self._BTN_STYLE_DISCONNECTED
 
     def _set_memory_status(self, message: str) -> None:
-        if hasattr(self, "memory_label"):
+        # Bursts of updates from one memory operation collapse into a single repaint.
+        flush_queued = self._pending_memory_status is not None
+        self._pending_memory_status = message
+        if not flush_queued:
+            QTimer.singleShot(0, self._flush_memory_status)
+
+    def _flush_memory_status(self) -> None:
+        message = self._pending_memory_status
+        self._pending_memory_status = None
+        if message is None or not hasattr(self, "memory_label"):
+            return
+        if self.memory_label.text() != message:
             self.memory_label.setText(message)
 
     def find_pduwp_pid(self) -> int | None:
+        # While connected, confirm the known PID instead of sweeping every process.
+        known_pid = self._last_pid
+        if known_pid is not None and known_pid > 0:
+            try:
+                known = psutil.Process(known_pid)
+                if known.is_running() and known.name().lower() in PDUWP_PROCESS_NAMES:
+                    return known_pid
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
         # Look for PDUWP.exe (case-insensitive)
-        for proc in psutil.process_iter(["pid", "name"]):  # type: ignore[misc]
+        for proc in psutil.process_iter(["name"]):  # type: ignore[misc]
             try:
                 name = proc.info["name"]
             except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -1935,8 +2662,8 @@ class MainWindow(QMainWindow):
             if not name:
                 continue
 
-            if name.lower() in ("pduwp.exe", "pduwp"):
-                return proc.info["pid"]
+            if name.lower() in PDUWP_PROCESS_NAMES:
+                return proc.pid
         return None
 
     def _attach_memory_client(self, pid: int) -> None:
@@ -1944,8 +2671,9 @@ class MainWindow(QMainWindow):
             self._set_memory_status("Memory: not available")
             return
 
-        self._skill_table_base = None
+        self._reset_skill_table_base()
         attached, message = self.memory_client.attach(pid)
+        self._module_base = self.memory_client.base_address if attached else None
         if attached:
             base_value = self.memory_client.base_address or 0
             pid_value = self.memory_client.pid or pid
@@ -1955,6 +2683,11 @@ class MainWindow(QMainWindow):
         else:
             self._set_memory_status(f"Memory: {message}")
 
+    def _abs_to_rel(self, address: int) -> int | None:
+        """Offset of ``address`` from the attached module base, or None when detached."""
+        base = self._module_base
+        return None if base is None else address - base
+
     def _report_live_memory_target(self, record: dict[str, str]) -> None:
         if not self.memory_client or not self.memory_client.attached:
             return
@@ -1973,8 +2706,8 @@ class MainWindow(QMainWindow):
 
         if isinstance(absolute_start, int) and absolute_start:
             target_address = absolute_start
-            if (self.memory_client.base_address is not None) and (relative_offset is None):
-                relative_offset = absolute_start - self.memory_client.base_address
+            if relative_offset is None:
+                relative_offset = self._abs_to_rel(absolute_start)
         elif relative_offset is not None:
             target_address = self.memory_client.address_for_offset(relative_offset)
 
@@ -1993,7 +2726,13 @@ class MainWindow(QMainWindow):
             f"Memory: PID {pid_value} {label} +0x{relative_value:X} -> 0x{target_address:016X} ({block_length} bytes)"
         )
 
-    def _write_live_memory(self, record: dict[str, str], hex_text: str) -> bool:
+    def _write_live_memory(
+        self,
+        record: dict[str, str],
+        hex_text: str,
+        stats: tuple[int, list[str]] | None = None,
+    ) -> bool:
+        """Write hex_text to the skill's live block; stats may pass already-computed hex_token_stats."""
         if not self.memory_client or not self.memory_client.attached:
             return False
 
@@ -2001,7 +2740,7 @@ class MainWindow(QMainWindow):
         if not hex_id:
             return False
 
-        pair_count, invalid_tokens = hex_token_stats(hex_text)
+        pair_count, invalid_tokens = stats if stats is not None else hex_token_stats(hex_text)
         if invalid_tokens:
             return False
 
@@ -2033,8 +2772,8 @@ class MainWindow(QMainWindow):
             target_address: int | None = None
             if isinstance(absolute_start, int) and absolute_start:
                 target_address = absolute_start
-                if relative_offset is None and self.memory_client.base_address is not None:
-                    relative_offset = absolute_start - self.memory_client.base_address
+                if relative_offset is None:
+                    relative_offset = self._abs_to_rel(absolute_start)
             elif relative_offset is not None:
                 target_address = self.memory_client.address_for_offset(relative_offset)
 
@@ -2043,6 +2782,8 @@ class MainWindow(QMainWindow):
 
             success, message = self.memory_client.write_memory(target_address, data)
             if success:
+                if target_address in self._live_prefetch:
+                    self._live_prefetch[target_address] = data
                 label = str(block.get("label", hex_id))
                 pid_value = self.memory_client.pid or 0
                 relative_value = int(relative_offset)
@@ -2053,59 +2794,96 @@ class MainWindow(QMainWindow):
 
             if not refreshed_pointer and self._skill_table_base is not None:
                 refreshed_pointer = True
-                self._skill_table_base = None
-                block.pop("absolute_start", None)
-                continue
+                if self._refresh_skill_table_base():
+                    block.pop("absolute_start", None)
+                    continue
 
             self._set_memory_status(f"Memory: {message}")
             return False
 
+    def _reset_skill_table_base(self) -> None:
+        self._skill_table_base = None
+        self._skill_table_version += 1
+        self._live_prefetch.clear()
+
+    def _refresh_skill_table_base(self) -> bool:
+        """Re-read the table pointer after a failed access; True when it moved and a retry can help."""
+        previous = self._skill_table_base
+        self._reset_skill_table_base()
+        return self._skill_table_base_address() != previous
+
+    def _block_target_address(self, block: dict[str, int | str]) -> int | None:
+        absolute_start = block.get("absolute_start")
+        if isinstance(absolute_start, int) and absolute_start:
+            return absolute_start
+        relative_offset = relative_offset_from_block(block)
+        if relative_offset is not None:
+            return self.memory_client.address_for_offset(relative_offset)
+        return None
+
+    def _prefetch_live_blocks(self, records: list[dict[str, str]]) -> None:
+        """Read every record's live block in one go; _load_skill_from_memory consumes the results."""
+        if not self.memory_client or not self.memory_client.attached:
+            return
+
+        addresses: list[int] = []
+        for record in records:
+            hex_id = record.get("hex_id")
+            block = self._resolve_live_block(hex_id, record) if hex_id else None
+            target_address = self._block_target_address(block) if block else None
+            if target_address is not None:
+                addresses.append(target_address)
+
+        payloads = self.memory_client.read_memory_scatter(
+            [(address, SKILL_BLOCK_SIZE) for address in addresses]
+        )
+        self._live_prefetch = {
+            address: payload for address, payload in zip(addresses, payloads) if payload
+        }
+
     def _resolve_live_block(
         self,
         hex_id: str,
         record: dict[str, str] | None = None,
     ) -> dict[str, int | str] | None:
         """Look up or derive the live memory block for a skill."""
+        cached_entry = self._live_block_cache.get(hex_id)
+        if cached_entry is not None and cached_entry[0] == self._skill_table_version:
+            return cached_entry[1]
+
+        skill_index = skill_index_from_hex(hex_id)
+        if skill_index < 0:
+            return LIVE_MEMORY_BLOCKS.get(hex_id)
+
         base_address = self._skill_table_base_address()
         if base_address is not None:
-            try:
-                skill_index = int(str(hex_id), 16)
-            except (TypeError, ValueError):
-                skill_index = -1
-            if 0 <= skill_index < MAX_SKILL_INDEX:
-                absolute_start = base_address + (skill_index * SKILL_BLOCK_SIZE)
-                relative_offset = None
-                if self.memory_client and self.memory_client.base_address is not None:
-                    relative_offset = absolute_start - self.memory_client.base_address
-
-                label = hex_id
-                if record:
-                    label = record.get("name", label) or label
-
-                dynamic_block: dict[str, int | str] = {
-                    "absolute_start": absolute_start,
-                    "length": SKILL_BLOCK_SIZE,
-                    "label": label,
-                }
-                if relative_offset is not None:
-                    dynamic_block["relative_offset"] = relative_offset
-
-                existing = LIVE_MEMORY_BLOCKS.get(hex_id, {})
-                existing.update(dynamic_block)
-                LIVE_MEMORY_BLOCKS[hex_id] = existing
-                return existing
-
-        cached = LIVE_MEMORY_BLOCKS.get(hex_id)
+            absolute_start = base_address + _SKILL_BLOCK_OFFSETS[skill_index]
+            relative_offset = self._abs_to_rel(absolute_start)
+
+            label = record.get("live_label", hex_id) if record else hex_id
+
+            dynamic_block: dict[str, int | str] = {
+                "absolute_start": absolute_start,
+                "length": SKILL_BLOCK_SIZE,
+                "label": label,
+            }
+            if relative_offset is not None:
+                dynamic_block["relative_offset"] = relative_offset
+
+            existing = _LIVE_MEMORY_BLOCKS_BY_INDEX[skill_index]
+            if existing is None:
+                existing = _LIVE_MEMORY_BLOCKS_BY_INDEX[skill_index] = LIVE_MEMORY_BLOCKS[hex_id] = {}
+            existing.update(dynamic_block)
+            self._live_block_cache[hex_id] = (self._skill_table_version, existing)
+            return existing
+
+        cached = _LIVE_MEMORY_BLOCKS_BY_INDEX[skill_index]
         if cached:
             return cached
 
-        relative_offset = skill_relative_offset_from_hex(hex_id)
-        if relative_offset is None:
-            return None
+        relative_offset = skill_relative_offset(skill_index)
 
-        label = hex_id
-        if record:
-            label = record.get("name", label) or label
+        label = record.get("live_label", hex_id) if record else hex_id
 
         block: dict[str, int | str] = {
             "relative_offset": relative_offset,
@@ -2113,7 +2891,7 @@ class MainWindow(QMainWindow):
             "length": SKILL_BLOCK_SIZE,
             "label": label,
         }
-        LIVE_MEMORY_BLOCKS[hex_id] = block
+        _LIVE_MEMORY_BLOCKS_BY_INDEX[skill_index] = LIVE_MEMORY_BLOCKS[hex_id] = block
         return block
 
     def _skill_table_base_address(self) -> int | None:
@@ -2127,28 +2905,36 @@ class MainWindow(QMainWindow):
         if pointer_address is None:
             return None
 
-        pointer_size = ctypes.sizeof(ctypes.c_void_p)
-        success, payload, message = self.memory_client.read_memory(pointer_address, pointer_size)
+        success, payload, message = self.memory_client.read_memory(pointer_address, _POINTER_SIZE)
         if not success or payload is None:
             if message:
                 self._set_memory_status(f"Memory: {message}")
             return None
+        if len(payload) < _POINTER_SIZE:
+            return None
 
-        base_address = int.from_bytes(payload, byteorder="little", signed=False)
+        (base_address,) = _POINTER_STRUCT.unpack_from(payload)
         if not base_address:
             return None
 
         self._skill_table_base = base_address
         pid_value = self.memory_client.pid or 0
-        base_offset = 0
-        if self.memory_client.base_address is not None:
-            base_offset = base_address - self.memory_client.base_address
+        base_offset = self._abs_to_rel(base_address) or 0
         self._set_memory_status(
             f"Memory: PID {pid_value} skill table @ 0x{base_address:016X} (+0x{base_offset:X})"
         )
         return self._skill_table_base
 
     def update_status(self, pid: int | None):
+        if pid == self._last_pid:
+            # Same process as the last poll: the UI is already current, only a
+            # failed memory attach is worth retrying.
+            client = self.memory_client
+            if pid is not None and client and client.is_supported() and not client.attached:
+                self._attach_memory_client(pid)
+            return
+        self._last_pid = pid
+
         if pid is None:
             if self.connected:
                 self.connected = False
@@ -2157,10 +2943,12 @@ class MainWindow(QMainWindow):
             self.connect_button.setStyleSheet(self._button_style(connected=False))
             self.tab_label.setText("Awaiting for PDUWP Connection.")
             self._set_menu_visibility(False)
+            self._stop_exit_watch()
             if self.memory_client:
                 self.memory_client.detach()
+            self._module_base = None
             self._set_memory_status("Memory: idle")
-            self._skill_table_base = None
+            self._reset_skill_table_base()
         else:
             if not self.connected:
                 self.connected = True
@@ -2170,6 +2958,43 @@ class MainWindow(QMainWindow):
             self.tab_label.setText("PDUWP Connection Confirmed!")
             self._set_menu_visibility(True)
             self._attach_memory_client(pid)
+            self._watch_process_exit(pid)
+
+    def _watch_process_exit(self, pid: int) -> None:
+        watcher = self._exit_watcher
+        if watcher is not None and watcher.pid == pid:
+            return
+        self._stop_exit_watch()
+        if not self.memory_client:
+            return
+        handle = self.memory_client.open_exit_handle(pid)
+        if handle is None:
+            return
+        stop_event = self.memory_client.create_stop_event()
+        if stop_event is None:
+            self.memory_client.close_handle(handle)
+            return
+
+        watcher = ProcessExitWatcher(self.memory_client, handle, stop_event, pid)
+        watcher.signals.exited.connect(self._on_watched_process_exited)
+        self._exit_watcher = watcher
+        self._exit_watch_pool.start(watcher)
+        self.timer.setInterval(PROCESS_POLL_WATCHED_MS)
+
+    def _stop_exit_watch(self) -> None:
+        watcher = self._exit_watcher
+        if watcher is None:
+            return
+        watcher.stop()
+        # A watcher still queued behind the previous one never runs; release it here.
+        if self._exit_watch_pool.tryTake(watcher):
+            watcher.close()
+        self._exit_watcher = None
+        self.timer.setInterval(PROCESS_POLL_MS)
+
+    def _on_watched_process_exited(self, pid: int) -> None:
+        if pid == self._last_pid:
+            self.check_pduwp_process()
 
     def check_pduwp_process(self):
         pid = self.find_pduwp_pid()
@@ -2180,19 +3005,15 @@ class MainWindow(QMainWindow):
         self.check_pduwp_process()
 
     def closeEvent(self, event: QCloseEvent) -> None:  # type: ignore[override]
+        self._stop_exit_watch()
+        self._release_debug_editor()
         if self.memory_client:
             self.memory_client.detach()
         super().closeEvent(event)
 
     def _build_menu_section(self, title: str) -> Dict[str, Any]:
         wrapper = QFrame()
-        wrapper.setStyleSheet(
-            "QFrame {"
-            "background-color: #1e1e1e;"
-            "border: 1px solid #333333;"
-            "border-radius: 3px;"
-            "}"
-        )
+        wrapper.setStyleSheet(MENU_SECTION_QSS)
         layout = QVBoxLayout(wrapper)
         layout.setContentsMargins(8, 6, 8, 8)
         layout.setSpacing(6)
@@ -2200,7 +3021,8 @@ class MainWindow(QMainWindow):
         toggle_button = QPushButton(title)
         toggle_button.setCheckable(True)
         toggle_button.setChecked(False)
-        toggle_button.setStyleSheet(self._menu_button_style(expanded=False, highlighted=False))
+        button_qss = self._MENU_BUTTON_STYLES[(False, False)]
+        toggle_button.setStyleSheet(button_qss)
         toggle_button.clicked.connect(partial(self._toggle_section, title))
         layout.addWidget(toggle_button)
 
@@ -2217,10 +3039,6 @@ class MainWindow(QMainWindow):
         content.setVisible(False)
         layout.addWidget(content)
 
-        opacity_effect = QGraphicsOpacityEffect(wrapper)
-        opacity_effect.setOpacity(1.0)
-        wrapper.setGraphicsEffect(opacity_effect)
-
         return {
             "wrapper": wrapper,
             "button": toggle_button,
@@ -2228,7 +3046,8 @@ class MainWindow(QMainWindow):
             "expanded": False,
             "placeholder": placeholder,
             "layout": content_layout,
-            "effect": opacity_effect,
+            "dim": False,
+            "button_qss": button_qss,
         }
 
     def _initialize_menu_content(self):
@@ -2248,107 +3067,48 @@ class MainWindow(QMainWindow):
             section["placeholder"].setParent(None)
             builder(section["layout"])
 
-    def _load_skill_records(self) -> list[dict[str, str]]:
-        records: list[dict[str, str]] = []
-        for meta_path in sorted(SKILL_DATA_ROOT.glob("*/meta.yaml")):
-            meta = self._parse_skill_meta(meta_path)
-            if not meta:
-                continue
-
-            folder = meta_path.parent
-            skill_data_path = folder / "skill_data.txt"
-            if skill_data_path.exists():
-                try:
-                    hex_dump = skill_data_path.read_text(encoding="utf-8").strip()
-                except OSError:
-                    hex_dump = "Skill data file could not be read."
-            else:
-                hex_dump = "Skill data file not yet provided."
-
-            pair_count, invalid_tokens = hex_token_stats(hex_dump)
-            hex_limit_value = str(pair_count) if pair_count and not invalid_tokens else "0"
-
-            raw_index = meta.get("order_index")
-            if isinstance(raw_index, int):
-                order_index_val = raw_index
-            else:
-                try:
-                    order_index_val = int(str(raw_index))
-                except (TypeError, ValueError):
-                    order_index_val = len(records)
-
-            def _text(value: Any, default: str = "-") -> str:
-                if value is None:
-                    return default
-                text = str(value)
-                return text if text else default
-
-            air_allowed_value = meta.get("air_allowed")
-            if air_allowed_value is None and "area_allowed" in meta:
-                air_allowed_value = meta.get("area_allowed")
-
-            record = {
-                "order_index": str(order_index_val),
-                "name": _text(meta.get("name"), folder.name.replace("_", " ").title()),
-                "hex_id": _text(meta.get("id_hex"), "0x0000"),
-                "school": _text(meta.get("school")),
-                "type": _text(meta.get("capsule_type")),
-                "cost": _text(meta.get("cost")),
-                "strength": _text(meta.get("strength")),
-                "uses": _text(meta.get("uses")),
-                "range": _text(meta.get("range")),
-                "rarity": _text(meta.get("rarity"), "Rarity ★"),
-                "description": _text(meta.get("description"), "Official data pending."),
-                "accuracy": _text(meta.get("accuracy")),
-                "air_allowed": _text(air_allowed_value),
-                "hit_box": _text(meta.get("hit_box")),
-                "projectile_count": _text(meta.get("projectile_count")),
-                "projectile_behavior": _text(meta.get("projectile_behavior")),
-                "skill_category": _text(meta.get("skill_category"), _text(meta.get("capsule_type"))),
-                "display_id": _text(meta.get("display_id")),
-                "register_id": _text(meta.get("register_id")),
-                "optional_id": _text(meta.get("optional_id")),
-                "hex_dump": hex_dump if hex_dump else "Skill data file not yet provided.",
-                "hex_limit": hex_limit_value,
-                "folder_path": str(folder),
-                "skill_file": str(skill_data_path),
-                "baseline_hex_dump": hex_dump if pair_count and not invalid_tokens else "",
-            }
-            records.append(record)
-
-        records.sort(key=lambda r: int(r.get("order_index", "0")))
-        return records
-
-    def _parse_skill_meta(self, meta_path: Path) -> Dict[str, Any]:
-        data: Dict[str, Any] = {}
-        try:
-            lines = meta_path.read_text(encoding="utf-8").splitlines()
-        except OSError:
-            return data
-
-        for raw_line in lines:
-            stripped = raw_line.strip()
-            if not stripped or stripped.startswith("#") or stripped.startswith("-"):
-                continue
-
-            key, sep, value = raw_line.partition(":")
-            if not sep:
-                continue
-
-            key = key.strip()
-            value = value.strip().strip('"')
-            if not value:
-                continue
+    @property
+    def skill_records(self) -> list[dict[str, str]]:
+        return self._ensure_skill_records()
+
+    def _ensure_skill_records(self) -> list[dict[str, str]]:
+        # Synchronous fallback when records are needed before the loader delivers;
+        # the late background result is then ignored.
+        if self._skill_records is None:
+            self._set_skill_records(self._load_skill_records())
+        assert self._skill_records is not None
+        return self._skill_records
+
+    def _set_skill_records(self, records: list[dict[str, str]]) -> None:
+        self._skill_records = records
+        self._skill_records_empty = not records
+        index_by_hex: dict[str, int] = {}
+        for index, record in enumerate(records):
+            hex_id = record.get("hex_id")
+            if hex_id:
+                # First record wins, matching the order a linear scan would find.
+                index_by_hex.setdefault(hex_id, index)
+        self._skill_index_by_hex = index_by_hex
+
+    def _record_for_hex(self, hex_id: str) -> dict[str, str] | None:
+        records = self._ensure_skill_records()
+        index = self._skill_index_by_hex.get(hex_id)
+        return None if index is None else records[index]
+
+    def _start_skill_record_load(self) -> None:
+        if self._skill_records is not None or self._skill_loader is not None:
+            return
+        # The loader is kept referenced so the runnable outlives its pool thread.
+        self._skill_loader = SkillRecordLoader(SKILL_DATA_ROOT)
+        self._skill_loader.signals.finished.connect(self._on_skill_records_loaded)
+        QThreadPool.globalInstance().start(self._skill_loader)
 
-            if key == "order_index":
-                try:
-                    data[key] = int(value)
-                except ValueError:
-                    continue
-            else:
-                data[key] = value
+    def _on_skill_records_loaded(self, records: list[dict[str, str]]) -> None:
+        if self._skill_records is None:
+            self._set_skill_records(records)
 
-        return data
+    def _load_skill_records(self) -> list[dict[str, str]]:
+        return load_skill_records(SKILL_DATA_ROOT)
 
     def _populate_skills_menu(self, layout: QVBoxLayout):
         base_stock_description = (
@@ -2393,19 +3153,7 @@ class MainWindow(QMainWindow):
             if handler:
                 button_label = "Browse" if title.startswith("Stock") else "Open"
                 button = QPushButton(button_label)
-                button.setStyleSheet(
-                    "QPushButton {"
-                    "background-color: #3c3c3c;"
-                    "color: #ffffff;"
-                    "border: 1px solid #4a4a4a;"
-                    "border-radius: 3px;"
-                    "padding: 4px 10px;"
-                    "font-size: 12px;"
-                    "}"
-                    "QPushButton:hover {"
-                    "background-color: #4b4b4b;"
-                    "}"
-                )
+                button.setStyleSheet(MENU_ACTION_BUTTON_QSS)
                 handler_button_layout = widget.layout()
                 if handler_button_layout is not None:
                     handler_button_layout.addWidget(button)
@@ -2421,67 +3169,39 @@ class MainWindow(QMainWindow):
         layout.addStretch()
 
     def _apply_slow_blink(self, button: QPushButton) -> None:
-        colors = ("#f1c232", "#ffd966")
-
-        def style_for(color: str) -> str:
-            return (
-                "QPushButton {"
-                f"background-color: {color};"
-                "color: #1b1b1b;"
-                "border: 1px solid #806000;"
-                "border-radius: 3px;"
-                "padding: 4px 10px;"
-                "font-size: 12px;"
-                "font-weight: bold;"
-                "}"
-                "QPushButton:hover {"
-                "background-color: #ffe699;"
-                "}"
-            )
-
-        button.setStyleSheet(style_for(colors[0]))
-        button.setProperty("_blink_index", 0)
-
-        timer = QTimer(self)
-        timer.setInterval(1200)
-
-        def on_timeout() -> None:
-            index = int(button.property("_blink_index") or 0)
-            index = (index + 1) % len(colors)
-            button.setProperty("_blink_index", index)
-            button.setStyleSheet(style_for(colors[index]))
-
-        timer.timeout.connect(on_timeout)
-        timer.start()
-        self._blink_timers.append(timer)
+        styles = self._BLINK_STYLES
+        button.setStyleSheet(styles[self._blink_phase])
+        self._blink_targets.append((button, styles))
+        if not self._master_blink_timer.isActive():
+            self._master_blink_timer.start()
+
+    def _tick_blinks(self) -> None:
+        self._blink_phase ^= 1
+        phase = self._blink_phase
+        for button, styles in self._blink_targets:
+            button.setStyleSheet(styles[phase])
 
     def _apply_warning_flash(self, label: QLabel, base_text: str, warning_text: str) -> None:
         label.setTextFormat(Qt.TextFormat.RichText)
-        colors = ("#f1c232", "#ffffff")
-
-        def render(color: str) -> None:
-            label.setText(
-                f"{html.escape(base_text)} "
-                f"<span style='color:{color}; font-weight:bold;'>{html.escape(warning_text)}</span>"
-            )
-
-        render(colors[0])
-        label.setProperty("_warning_index", 0)
-
-        timer = QTimer(self)
-        timer.setInterval(1300)
-
-        def on_timeout() -> None:
-            index = int(label.property("_warning_index") or 0)
-            index = (index + 1) % len(colors)
-            label.setProperty("_warning_index", index)
-            render(colors[index])
-
-        timer.timeout.connect(on_timeout)
-        timer.start()
-        self._blink_timers.append(timer)
-
-    def _fetch_skill_hex_data(self, index: int) -> str:
+        base_html = html.escape(base_text)
+        warning_html = html.escape(warning_text)
+        # Both flash states are fixed, so ticks only swap between two prebuilt strings.
+        rendered = tuple(
+            f"{base_html} <span style='color:{color}; font-weight:bold;'>{warning_html}</span>"
+            for color in ("#f1c232", "#ffffff")
+        )
+        label.setText(rendered[self._flash_phase])
+        self._flash_targets.append((label, rendered))
+        if not self._master_flash_timer.isActive():
+            self._master_flash_timer.start()
+
+    def _tick_flashes(self) -> None:
+        self._flash_phase ^= 1
+        phase = self._flash_phase
+        for label, rendered in self._flash_targets:
+            label.setText(rendered[phase])
+
+    def _fetch_skill_hex_data(self, index: int, live: bool = False) -> str:
         if not (0 <= index < len(self.skill_records)):
             return "Skill data file not yet provided."
 
@@ -2489,7 +3209,7 @@ class MainWindow(QMainWindow):
         resolved_dump = None
 
         if self.memory_client and self.memory_client.attached:
-            resolved_dump = self._load_skill_from_memory(record)
+            resolved_dump = self._load_skill_from_memory(record, live)
 
         if not resolved_dump:
             resolved_dump = self._load_skill_from_disk(record)
@@ -2509,7 +3229,7 @@ class MainWindow(QMainWindow):
             )
             return
 
-        record = next((r for r in self.skill_records if r.get("hex_id") == hex_id), None)
+        record = self._record_for_hex(hex_id)
         if not record:
             QMessageBox.warning(
                 self,
@@ -2518,6 +3238,7 @@ class MainWindow(QMainWindow):
             )
             return
 
+        name = record.get("name", hex_id)
         refreshed_pointer = False
         while True:
             block = self._resolve_live_block(hex_id, record)
@@ -2536,8 +3257,8 @@ class MainWindow(QMainWindow):
             target_address: int | None = None
             if isinstance(absolute_start, int) and absolute_start:
                 target_address = absolute_start
-                if relative_offset is None and self.memory_client.base_address is not None:
-                    relative_offset = absolute_start - self.memory_client.base_address
+                if relative_offset is None:
+                    relative_offset = self._abs_to_rel(absolute_start)
 
             if target_address is None and relative_offset is not None:
                 target_address = self.memory_client.address_for_offset(relative_offset)
@@ -2556,25 +3277,25 @@ class MainWindow(QMainWindow):
 
             if not refreshed_pointer and self._skill_table_base is not None:
                 refreshed_pointer = True
-                self._skill_table_base = None
-                block.pop("absolute_start", None)
-                continue
+                if self._refresh_skill_table_base():
+                    block.pop("absolute_start", None)
+                    continue
 
             detail = message if message else "ReadProcessMemory returned no data."
             QMessageBox.warning(
                 self,
                 "Live Memory",
                 (
-                    f"Read attempt failed for {record.get('name', hex_id)} (hex {hex_id}).\n"
+                    f"Read attempt failed for {name} (hex {hex_id}).\n"
                     f"Address: 0x{target_address:016X}\n"
                     f"Reason: {detail}"
                 ),
             )
             return
 
-        snippet = " ".join(f"{byte:02X}" for byte in payload[:16])
+        snippet = memoryview(payload)[:16].hex(" ").upper()
         message_lines = [
-            f"Skill: {record.get('name', hex_id)}",
+            f"Skill: {name}",
             f"Hex ID: {hex_id}",
             f"Skill Table Pointer: 0x{base_pointer:016X}" if base_pointer else "Skill Table Pointer: unresolved",
             f"Relative Offset: +0x{relative_offset:X}",
@@ -2588,6 +3309,19 @@ class MainWindow(QMainWindow):
             "\n".join(message_lines),
         )
 
+    def _remember_disk_state(
+        self, record: dict[str, str], skill_path: Path, canonical: str, mtime_ns: str | None = None
+    ) -> None:
+        """Note the canonical text and mtime of the skill file just read or written."""
+        record["hex_hash"] = hex_digest(canonical)
+        if mtime_ns is not None:
+            record["disk_mtime_ns"] = mtime_ns
+            return
+        try:
+            record["disk_mtime_ns"] = str(skill_path.stat().st_mtime_ns)
+        except OSError:
+            record.pop("disk_mtime_ns", None)
+
     def _load_skill_from_disk(self, record: dict[str, str]) -> str | None:
         path_value = record.get("skill_file")
         if not path_value:
@@ -2595,8 +3329,20 @@ class MainWindow(QMainWindow):
 
         skill_path = Path(path_value)
         try:
-            if not skill_path.exists():
-                return None
+            mtime_ns = str(skill_path.stat().st_mtime_ns)
+        except OSError:
+            return None
+
+        # The record still holds the text of this untouched file; skip the read and parse.
+        known_text = record.get("hex_dump")
+        if (
+            known_text
+            and record.get("disk_mtime_ns") == mtime_ns
+            and record.get("hex_hash") == hex_digest(known_text)
+        ):
+            return known_text
+
+        try:
             raw_text = skill_path.read_text(encoding="utf-8")
         except OSError:
             return None
@@ -2605,17 +3351,18 @@ class MainWindow(QMainWindow):
         if not stripped:
             return None
 
-        pair_count, invalid_tokens = hex_token_stats(stripped)
+        pair_count, invalid_tokens = cached_hex_token_stats(stripped)
         if invalid_tokens or pair_count <= 0:
             record["hex_dump"] = stripped
             return stripped
 
-        formatted = normalize_hex_text(stripped)
+        formatted = cached_normalize_hex_text(stripped)
         record["hex_dump"] = formatted
         record["hex_limit"] = str(pair_count)
+        self._remember_disk_state(record, skill_path, formatted, mtime_ns)
         return formatted
 
-    def _load_skill_from_memory(self, record: dict[str, str]) -> str | None:
+    def _load_skill_from_memory(self, record: dict[str, str], live: bool = False) -> str | None:
         if not self.memory_client or not self.memory_client.attached:
             return None
 
@@ -2629,28 +3376,26 @@ class MainWindow(QMainWindow):
             if not block:
                 return None
 
-            absolute_start = block.get("absolute_start")
-            target_address: int | None = None
-            relative_offset = relative_offset_from_block(block)
-
-            if isinstance(absolute_start, int) and absolute_start:
-                target_address = absolute_start
-            elif relative_offset is not None:
-                target_address = self.memory_client.address_for_offset(relative_offset)
-
+            target_address = self._block_target_address(block)
             if target_address is None:
                 return None
 
+            payload = None if live else self._live_prefetch.get(target_address)
+            if payload is not None:
+                break
+
             success, payload, message = self.memory_client.read_memory(target_address, SKILL_BLOCK_SIZE)
             if success and payload is not None:
+                if target_address in self._live_prefetch:
+                    self._live_prefetch[target_address] = payload
                 break
 
             if not refreshed_pointer and self._skill_table_base is not None:
-                # Pointer may have moved; drop the cached value and retry once.
+                # Pointer may have moved; re-read it and retry once if it did.
                 refreshed_pointer = True
-                self._skill_table_base = None
-                block.pop("absolute_start", None)
-                continue
+                if self._refresh_skill_table_base():
+                    block.pop("absolute_start", None)
+                    continue
 
             if message:
                 self._set_memory_status(f"Memory: {message}")
@@ -2660,27 +3405,36 @@ class MainWindow(QMainWindow):
         if payload_length != SKILL_BLOCK_SIZE:
             # Notify when the read yielded an unexpected size but still continue with what we have.
             self._set_memory_status(
-                f"Memory: expected {SKILL_BLOCK_SIZE} bytes, received {payload_length} (hex {record.get('hex_id', '-')})"
+                f"Memory: expected {SKILL_BLOCK_SIZE} bytes, received {payload_length} (hex {hex_id})"
             )
 
-        tokens = " ".join(f"{byte:02X}" for byte in payload)
-        formatted = normalize_hex_text(tokens)
+        formatted = format_hex_bytes(payload)
         record["hex_dump"] = formatted
         record["hex_limit"] = str(payload_length if payload_length else SKILL_BLOCK_SIZE)
         record["baseline_hex_dump"] = formatted
 
         pid_value = self.memory_client.pid or 0
-        label = record.get("name", record.get("hex_id", "Skill"))
+        label = record.get("name", hex_id)
         self._set_memory_status(
             f"Memory: PID {pid_value} read {payload_length} byte(s) for {label}"
         )
 
+        # Mirror the block to disk only when it differs from what the file already holds.
         path_value = record.get("skill_file")
-        if path_value:
+        digest = hex_digest(formatted)
+        if path_value and record.get("hex_hash") != digest:
+            skill_path = Path(path_value)
+            temp_path = skill_path.with_name(skill_path.name + ".tmp")
             try:
-                Path(path_value).write_text(formatted + "\n", encoding="utf-8")
+                temp_path.write_text(formatted + "\n", encoding="utf-8")
+                os.replace(temp_path, skill_path)
+                self._remember_disk_state(record, skill_path, formatted)
             except OSError:
-                pass
+                # Don't leave a half-finished mirror next to the skill file.
+                try:
+                    temp_path.unlink(missing_ok=True)
+                except OSError:
+                    pass
 
         return formatted
 
@@ -2700,7 +3454,7 @@ class MainWindow(QMainWindow):
             )
             return False
 
-        pair_count, invalid_tokens = hex_token_stats(hex_text)
+        pair_count, invalid_tokens = cached_hex_token_stats(hex_text)
         if invalid_tokens:
             preview = ", ".join(invalid_tokens[:3])
             if len(invalid_tokens) > 3:
@@ -2733,39 +3487,59 @@ class MainWindow(QMainWindow):
             )
             return False
 
-        normalized = normalize_hex_text(hex_text)
         folder = Path(folder_value)
         skill_path = Path(skill_file_value)
         backup_path = folder / BACKUP_FILENAME
 
+        # Unchanged mtime means the file still holds the text behind record["hex_hash"].
+        known_digest: str | None = None
+        try:
+            if str(skill_path.stat().st_mtime_ns) == record.get("disk_mtime_ns"):
+                known_digest = record.get("hex_hash")
+        except OSError:
+            pass
+
+        # Same text as the skill file already holds: only the live copy needs updating.
+        if known_digest is not None and known_digest == hex_digest(hex_text):
+            record["hex_dump"] = hex_text
+            record["hex_limit"] = str(pair_count)
+            wrote = self._write_live_memory(record, hex_text, (pair_count, invalid_tokens))
+            if not wrote:
+                self._report_live_memory_target(record)
+            return True
+
+        normalized = cached_normalize_hex_text(hex_text)
+
         previous_raw: str | None = None
-        if skill_path.exists():
-            try:
-                previous_raw = skill_path.read_text(encoding="utf-8")
-            except OSError as exc:
-                QMessageBox.warning(
-                    self,
-                    "Save Hex Data",
-                    f"Could not read existing skill data file:\n{exc}",
-                )
-                return False
+        try:
+            previous_raw = skill_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            QMessageBox.warning(
+                self,
+                "Save Hex Data",
+                f"Could not read existing skill data file:\n{exc}",
+            )
+            return False
 
         previous_trimmed = previous_raw.strip() if previous_raw is not None else None
         previous_canonical: str | None = None
-        if previous_trimmed:
-            prev_pair, prev_invalid = hex_token_stats(previous_trimmed)
-            if not prev_invalid and prev_pair > 0:
-                previous_canonical = normalize_hex_text(previous_trimmed)
-
         data_changed = True
-        if previous_canonical is not None:
-            data_changed = previous_canonical != normalized
+        if known_digest is not None:
+            data_changed = hex_digest(normalized) != known_digest
+        elif previous_trimmed:
+            prev_pair, prev_invalid = cached_hex_token_stats(previous_trimmed)
+            if not prev_invalid and prev_pair > 0:
+                previous_canonical = cached_normalize_hex_text(previous_trimmed)
+                data_changed = previous_canonical != normalized
 
         if not data_changed:
             record_hex = previous_canonical or normalized
             record["hex_dump"] = record_hex
             record["hex_limit"] = str(pair_count)
-            wrote = self._write_live_memory(record, record_hex)
+            self._remember_disk_state(record, skill_path, record_hex)
+            wrote = self._write_live_memory(record, record_hex, (pair_count, invalid_tokens))
             if not wrote:
                 self._report_live_memory_target(record)
             return True
@@ -2780,9 +3554,15 @@ class MainWindow(QMainWindow):
             )
             return False
 
-        if previous_raw is not None and previous_raw.strip() and not backup_path.exists():
+        if previous_raw is not None and previous_raw.strip():
+            # Exclusive create: an existing backup is the original and must stay untouched.
+            backup_created = False
             try:
-                backup_path.write_text(previous_raw, encoding="utf-8")
+                with open(backup_path, "x", encoding="utf-8") as backup_file:
+                    backup_file.write(previous_raw)
+                backup_created = True
+            except FileExistsError:
+                pass
             except OSError as exc:
                 QMessageBox.warning(
                     self,
@@ -2790,7 +3570,7 @@ class MainWindow(QMainWindow):
                     f"Could not create a backup copy:\n{exc}",
                 )
                 return False
-            if previous_trimmed and not record.get("baseline_hex_dump"):
+            if backup_created and previous_trimmed and not record.get("baseline_hex_dump"):
                 record["baseline_hex_dump"] = previous_trimmed
 
         try:
@@ -2806,7 +3586,8 @@ class MainWindow(QMainWindow):
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         temp_path = folder / f"{TEMP_EDIT_PREFIX}{timestamp}.txt"
         try:
-            temp_path.write_text((normalized + "\n") if normalized else "\n", encoding="utf-8")
+            # Same bytes as the skill file just written, so copy instead of re-encoding.
+            shutil.copyfile(skill_path, temp_path)
         except OSError as exc:
             QMessageBox.warning(
                 self,
@@ -2819,10 +3600,11 @@ class MainWindow(QMainWindow):
 
         record["hex_dump"] = normalized
         record["hex_limit"] = str(pair_count)
+        self._remember_disk_state(record, skill_path, normalized)
         if not record.get("baseline_hex_dump") and previous_trimmed:
             record["baseline_hex_dump"] = previous_trimmed
 
-        wrote = self._write_live_memory(record, normalized)
+        wrote = self._write_live_memory(record, normalized, (pair_count, invalid_tokens))
         if not wrote:
             self._report_live_memory_target(record)
         return True
@@ -2850,13 +3632,12 @@ class MainWindow(QMainWindow):
         source_raw: str | None = None
         source_canonical: str | None = None
         try:
-            if backup_path.exists():
-                source_raw = backup_path.read_text(encoding="utf-8")
-            else:
-                baseline = record.get("baseline_hex_dump", "")
-                if baseline:
-                    source_canonical = normalize_hex_text(baseline)
-                    source_raw = (source_canonical + "\n") if source_canonical else "\n"
+            source_raw = backup_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            baseline = record.get("baseline_hex_dump", "")
+            if baseline:
+                source_canonical = cached_normalize_hex_text(baseline)
+                source_raw = (source_canonical + "\n") if source_canonical else "\n"
         except OSError as exc:
             QMessageBox.warning(
                 self,
@@ -2877,7 +3658,7 @@ class MainWindow(QMainWindow):
             return False
 
         if source_canonical is None:
-            source_canonical = normalize_hex_text(source_raw.strip())
+            source_canonical = cached_normalize_hex_text(source_raw.strip())
 
         try:
             target_text = source_raw if source_raw.endswith("\n") else source_raw + "\n"
@@ -2891,12 +3672,13 @@ class MainWindow(QMainWindow):
             return False
 
         record["hex_dump"] = source_canonical
-        pair_count, invalid_tokens = hex_token_stats(source_canonical)
+        self._remember_disk_state(record, skill_path, source_canonical)
+        pair_count, invalid_tokens = cached_hex_token_stats(source_canonical)
         if not invalid_tokens and pair_count > 0:
             record["hex_limit"] = str(pair_count)
         record["baseline_hex_dump"] = source_canonical
 
-        wrote = self._write_live_memory(record, source_canonical)
+        wrote = self._write_live_memory(record, source_canonical, (pair_count, invalid_tokens))
         if not wrote:
             self._report_live_memory_target(record)
         return True
@@ -2924,19 +3706,7 @@ class MainWindow(QMainWindow):
             widget = self._menu_entry_widget(title, description)
             if handler:
                 button = QPushButton("Open")
-                button.setStyleSheet(
-                    "QPushButton {"
-                    "background-color: #3c3c3c;"
-                    "color: #ffffff;"
-                    "border: 1px solid #4a4a4a;"
-                    "border-radius: 3px;"
-                    "padding: 4px 10px;"
-                    "font-size: 12px;"
-                    "}"
-                    "QPushButton:hover {"
-                    "background-color: #4b4b4b;"
-                    "}"
-                )
+                button.setStyleSheet(MENU_ACTION_BUTTON_QSS)
                 container = widget.layout()
                 if container is not None:
                     container.addWidget(button)
@@ -2973,7 +3743,7 @@ class MainWindow(QMainWindow):
         for title, description in items:
             layout.addWidget(self._menu_entry_widget(title, description))
 
-        layout.addWidget(self._map_index_widget())
+        self._add_deferred_widget(layout, "Show Map Index", self._map_index_widget)
 
         layout.addStretch()
 
@@ -3000,7 +3770,7 @@ class MainWindow(QMainWindow):
         for title, description in items:
             layout.addWidget(self._menu_entry_widget(title, description))
 
-        layout.addWidget(self._character_index_widget())
+        self._add_deferred_widget(layout, "Show Character Index", self._character_index_widget)
 
         layout.addStretch()
 
@@ -3061,15 +3831,26 @@ class MainWindow(QMainWindow):
 
         layout.addStretch()
 
+    def _add_deferred_widget(
+        self,
+        layout: QVBoxLayout,
+        button_text: str,
+        factory: Callable[[], QWidget],
+    ) -> None:
+        """Add a button that builds the real widget in its place on first click."""
+        button = QPushButton(button_text)
+        button.setStyleSheet(MENU_ACTION_BUTTON_QSS)
+
+        def expand() -> None:
+            layout.replaceWidget(button, factory())
+            button.deleteLater()
+
+        button.clicked.connect(expand)
+        layout.addWidget(button)
+
     def _map_index_widget(self) -> QFrame:
         frame = QFrame()
-        frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #2a2a2a;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        frame.setStyleSheet(SECTION_FRAME_QSS)
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(10, 8, 10, 10)
@@ -3079,7 +3860,7 @@ class MainWindow(QMainWindow):
         header.setStyleSheet("color: #f0f0f0; font-size: 14px; font-weight: bold;")
         layout.addWidget(header)
 
-        summary_label = QLabel(self._map_summary_html())
+        summary_label = QLabel(map_summary_html())
         summary_label.setStyleSheet(f"color: {VS_TEXT}; font-size: 12px;")
         summary_label.setTextFormat(Qt.TextFormat.RichText)
         summary_label.setWordWrap(True)
@@ -3101,7 +3882,7 @@ class MainWindow(QMainWindow):
         table_layout.setContentsMargins(0, 0, 0, 0)
         table_layout.setSpacing(0)
 
-        table_label = QLabel(self._map_table_html())
+        table_label = QLabel(map_table_html())
         table_label.setStyleSheet(f"color: {VS_TEXT}; font-size: 12px;")
         table_label.setTextFormat(Qt.TextFormat.RichText)
         table_label.setWordWrap(True)
@@ -3114,13 +3895,7 @@ class MainWindow(QMainWindow):
 
     def _character_index_widget(self) -> QFrame:
         frame = QFrame()
-        frame.setStyleSheet(
-            "QFrame {"
-            "background-color: #2a2a2a;"
-            "border: 1px solid #3a3a3a;"
-            "border-radius: 3px;"
-            "}"
-        )
+        frame.setStyleSheet(SECTION_FRAME_QSS)
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(10, 8, 10, 10)
@@ -3155,9 +3930,9 @@ class MainWindow(QMainWindow):
         container_layout.setSpacing(12)
 
         for title, data in (
-            ("Playable Characters", PLAYABLE_CHARACTERS),
-            ("NPCs", NPC_CHARACTERS),
-            ("Enemies", ENEMY_CHARACTERS),
+            ("Playable Characters", _PLAYABLE_CHARACTERS_ESCAPED),
+            ("NPCs", _NPC_CHARACTERS_ESCAPED),
+            ("Enemies", _ENEMY_CHARACTERS_ESCAPED),
         ):
             container_layout.addWidget(self._character_table_label(title, data))
 
@@ -3166,58 +3941,8 @@ class MainWindow(QMainWindow):
 
         return frame
 
-    def _map_summary_html(self) -> str:
-        items = "".join(
-            f"<li><strong>{html.escape(name)}</strong>: {html.escape(description)}</li>"
-            for name, description in MAP_SUMMARY
-        )
-        return f"<p style='margin:0 0 6px 0;'>Key locale notes:</p><ul style='margin:0 0 8px 16px;'>{items}</ul>"
-
-    def _map_table_html(self) -> str:
-        header = (
-            "<tr>"
-            "<th style='text-align:left;padding:4px 8px;'>Map</th>"
-            "<th style='text-align:left;padding:4px 8px;'>Map Name</th>"
-            "<th style='text-align:left;padding:4px 8px;'>Internal Name</th>"
-            "<th style='text-align:left;padding:4px 8px;'>ID</th>"
-            "</tr>"
-        )
-        rows = "".join(
-            "<tr>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['map'])}</td>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['map_name'])}</td>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['internal'])}</td>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['id'])}</td>"
-            "</tr>"
-            for entry in MAP_INDEX
-        )
-        return (
-            "<table style='border-collapse:collapse;width:100%;'>"
-            f"<thead style='background-color:#333333;color:#ffffff;'>{header}</thead>"
-            f"<tbody>{rows}</tbody></table>"
-        )
-
-    def _character_table_label(self, title: str, rows: list[dict[str, str]]) -> QLabel:
-        header = (
-            "<tr>"
-            "<th style='text-align:left;padding:4px 8px;'>Name</th>"
-            "<th style='text-align:left;padding:4px 8px;'>ID</th>"
-            "</tr>"
-        )
-        body = "".join(
-            "<tr>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['name'])}</td>"
-            f"<td style='padding:4px 8px;'>{html.escape(entry['id'])}</td>"
-            "</tr>"
-            for entry in rows
-        )
-        table_html = (
-            f"<h4 style='margin:0 0 4px 0;color:#f0f0f0;font-size:13px;'>{html.escape(title)}</h4>"
-            "<table style='border-collapse:collapse;width:100%;margin-bottom:6px;'>"
-            f"<thead style='background-color:#333333;color:#ffffff;'>{header}</thead>"
-            f"<tbody>{body}</tbody></table>"
-        )
-        label = QLabel(table_html)
+    def _character_table_label(self, title: str, rows: tuple[CharacterRow, ...]) -> QLabel:
+        label = QLabel(character_table_html(title, rows))
         label.setStyleSheet(f"color: {VS_TEXT}; font-size: 12px;")
         label.setTextFormat(Qt.TextFormat.RichText)
         label.setWordWrap(True)
@@ -3225,13 +3950,7 @@ class MainWindow(QMainWindow):
 
     def _menu_entry_widget(self, title: str, description: str) -> QFrame:
         entry = QFrame()
-        entry.setStyleSheet(
-            "QFrame {"
-            "background-color: #2e2e2e;"
-            "border: 1px solid #3b3b3b;"
-            "border-radius: 3px;"
-            "}"
-        )
+        entry.setStyleSheet(FIELD_FRAME_QSS)
         entry_layout = QVBoxLayout(entry)
         entry_layout.setContentsMargins(10, 8, 10, 10)
         entry_layout.setSpacing(4)
@@ -3249,110 +3968,170 @@ class MainWindow(QMainWindow):
         return entry
 
 
+    def _show_cached_message(self, icon: QMessageBox.Icon, title: str, text: str) -> None:
+        # Repeatable notices build their box once and reuse it on later clicks.
+        key = (icon, title, text)
+        box = self._message_boxes.get(key)
+        if box is None:
+            box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+            self._message_boxes[key] = box
+        box.exec()
+
+    def _show_no_skill_records(self) -> None:
+        self._show_cached_message(
+            QMessageBox.Icon.Information,
+            "Skill Data Unavailable",
+            "No skill records were loaded. Add meta files to data/skills to continue.",
+        )
+
     def _open_stock_browser(self) -> None:
-        if not self.skill_records:
-            QMessageBox.information(
-                self,
-                "Skill Data Unavailable",
-                "No skill records were loaded. Add meta files to data/skills to continue.",
-            )
+        self._ensure_skill_records()
+        if self._skill_records_empty:
+            self._show_no_skill_records()
             return
 
-        dialog = StockBrowserDialog(self, self.skill_records)
+        dialog = self._stock_dialog
+        if dialog is None or dialog.records is not self.skill_records:
+            dialog = self._stock_dialog = StockBrowserDialog(self, self.skill_records)
+        else:
+            dialog.refresh()
         dialog.exec()
 
 
     def _open_debug_editor(self) -> None:
-        base_dir = Path(sys.argv[0]).resolve().parent
-        entry_point = base_dir / "data" / "stageset" / "stageset_editor.py"
-        if not entry_point.exists():
-            QMessageBox.warning(
-                self,
+        if self._editor_launching or self._show_running_debug_editor():
+            return
+        self._release_debug_editor()
+        entry_point = self._editor_entry
+        if not self._editor_entry_exists:
+            self._show_cached_message(
+                QMessageBox.Icon.Warning,
                 "Debug Editor",
                 f"The stageset_editor.py entry point is missing.\nExpected at:\n{entry_point}",
             )
             return
 
-        python_exe = Path(sys.executable)
-        if python_exe.name.lower() != "python.exe":
-            candidate = Path(sys.base_prefix) / "python.exe"
-            if candidate.exists():
-                python_exe = candidate
-            else:
-                python_exe = Path("python")
+        # The launcher is kept referenced so the runnable outlives its pool thread.
+        self._editor_launching = True
+        self._editor_launcher = DebugEditorLauncher(
+            [str(self._editor_python), str(entry_point), "--serve"]
+        )
+        self._editor_launcher.signals.launched.connect(self._on_debug_editor_launched)
+        self._editor_launcher.signals.failed.connect(self._on_debug_editor_failed)
+        QThreadPool.globalInstance().start(self._editor_launcher)
+
+    def _on_debug_editor_launched(self, proc: subprocess.Popen[bytes]) -> None:
+        self._editor_launching = False
+        self._editor_proc = proc
+
+    def _on_debug_editor_failed(self, message: str) -> None:
+        self._editor_launching = False
+        QMessageBox.critical(
+            self,
+            "Debug Editor Error",
+            f"Failed to launch Debug Editor:\n{message}",
+        )
 
+    def _show_running_debug_editor(self) -> bool:
+        """Ask an already running editor to show itself; False if it has to be spawned."""
+        proc = self._editor_proc
+        if proc is None or proc.poll() is not None or proc.stdin is None:
+            return False
         try:
-            subprocess.Popen([str(python_exe), str(entry_point)])
-        except Exception as exc:  # noqa: BLE001
-            QMessageBox.critical(
-                self,
-                "Debug Editor Error",
-                f"Failed to launch Debug Editor:\n{exc}",
-            )
+            proc.stdin.write(b"SHOW\n")
+            proc.stdin.flush()
+        except OSError:
+            return False
+        return True
+
+    def _release_debug_editor(self) -> None:
+        # Closing the pipe lets a hidden editor exit; a visible one stays open.
+        proc, self._editor_proc = self._editor_proc, None
+        if proc is not None and proc.stdin is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
 
 
     def _open_skill_stats_example(self):
-        if not self.skill_records:
-            QMessageBox.information(
-                self,
-                "Skill Data Unavailable",
-                "No skill records were loaded. Add meta files to data/skills to continue.",
-            )
+        self._ensure_skill_records()
+        if self._skill_records_empty:
+            self._show_no_skill_records()
             return
 
-        dialog = SkillStatsDialog(
-            self,
-            self.skill_records,
-            self._fetch_skill_hex_data,
-            self._save_skill_data,
-            self._revert_skill_data,
-            self.connected,
-        )
+        self._prefetch_live_blocks(self.skill_records)
+        dialog = self._skill_stats_dialog
+        if dialog is None or dialog.records is not self.skill_records:
+            dialog = self._skill_stats_dialog = SkillStatsDialog(
+                self,
+                self.skill_records,
+                self._fetch_skill_hex_data,
+                self._save_skill_data,
+                self._revert_skill_data,
+                self.connected,
+            )
+        else:
+            dialog.refresh(self.connected)
         dialog.exec()
+        # The snapshot belongs to this session; reads outside the dialog go live.
+        self._live_prefetch.clear()
 
     def _toggle_section(self, title: str):
         if title not in self.menu_sections:
             return
 
         self.active_menu = None if self.active_menu == title else title
+        if self.active_menu == "Skills":
+            self._start_skill_record_load()
         self._apply_menu_state()
 
     def _apply_menu_state(self):
-        for name, section in self.menu_sections.items():
-            is_active = name == self.active_menu
-            section["expanded"] = is_active
-            section["content"].setVisible(is_active)
-            section["button"].setChecked(is_active)
-            section["button"].setStyleSheet(
-                self._menu_button_style(expanded=is_active, highlighted=is_active)
-            )
-            section["effect"].setOpacity(1.0 if is_active or self.active_menu is None else 0.35)
-
-            parent_layout = section["wrapper"].parentWidget().layout()
-            if is_active and parent_layout is not None:
-                parent_layout.removeWidget(section["wrapper"])
-                parent_layout.insertWidget(0, section["wrapper"])
-
-    def _menu_button_style(self, expanded: bool, highlighted: bool) -> str:
-        base_color = "#394049" if expanded else "#333333"
-        hover_color = "#46505c" if expanded else "#3d3d3d"
-        text_color = "#ffffff" if highlighted else "#dcdcdc"
-        return (
-            "QPushButton {"
-            f"background-color: {base_color};"
-            f"color: {text_color};"
-            "border: none;"
-            "padding: 6px 10px;"
-            "text-align: left;"
-            "font-size: 13px;"
-            "}"
-            "QPushButton:hover {"
-            f"background-color: {hover_color};"
-            "}"
-            "QPushButton:pressed {"
-            "background-color: #2d2d2d;"
-            "}"
-        )
+        state = (self.active_menu, not self.menu_panel.isHidden())
+        previous = self._last_menu_state
+        if state == previous:
+            return
+        self._last_menu_state = state
+
+        names = list(self.menu_sections)
+        if previous is not None and previous[1] == state[1]:
+            previous_active = previous[0]
+            # Switching between two sections leaves the dimming of the rest as is.
+            if (previous_active is None) == (self.active_menu is None):
+                names = [name for name in (previous_active, self.active_menu) if name is not None]
+
+        for name in names:
+            self._style_section(name, name == self.active_menu)
+
+    def _style_section(self, name: str, is_active: bool) -> None:
+        section = self.menu_sections[name]
+        section["expanded"] = is_active
+        content = section["content"]
+        if content.isHidden() == is_active:
+            content.setVisible(is_active)
+        # A click has usually flipped the checkable button already.
+        button = section["button"]
+        if button.isChecked() != is_active:
+            button.setChecked(is_active)
+        button_qss = self._MENU_BUTTON_STYLES[(is_active, is_active)]
+        # Qt re-polishes on every assignment, even for identical text.
+        if section["button_qss"] is not button_qss:
+            section["button"].setStyleSheet(button_qss)
+            section["button_qss"] = button_qss
+        dim = not is_active and self.active_menu is not None
+        if section["dim"] != dim:
+            section["dim"] = dim
+            for widget in (section["wrapper"], section["button"]):
+                widget.setProperty("dim", dim)
+                style = widget.style()
+                style.unpolish(widget)
+                style.polish(widget)
+
+        parent_layout = section["parent_layout"]
+        # Moving a wrapper that is already first would still invalidate the layout.
+        if is_active and parent_layout.indexOf(section["wrapper"]) > 0:
+            parent_layout.removeWidget(section["wrapper"])
+            parent_layout.insertWidget(0, section["wrapper"])
 
     def _set_menu_visibility(self, visible: bool):
         self.menu_panel.setVisible(visible)
@@ -3361,27 +4140,25 @@ class MainWindow(QMainWindow):
         self._apply_menu_state()
 
     def _advance_intro_text(self):
-        if self.intro_display_index < len(self.intro_full_text):
-            self.intro_display_index += 1
-            self.intro_label.setText(self.intro_full_text[: self.intro_display_index])
-        else:
+        # A starved event loop skips ahead instead of stalling the reveal.
+        elapsed_ms = (time.monotonic() - self._intro_started) * 1000
+        due = int(elapsed_ms // INTRO_TICK_MS) - 1
+        last = self.intro_label.frame_count() - 1
+        frame = min(due, last)
+        if frame != self.intro_display_index:
+            self.intro_display_index = frame
+            self.intro_label.set_frame(frame)
+        elif due > last:
+            # Fade only once the full text has been on screen for a tick.
             self.intro_timer.stop()
             self._start_intro_fade()
 
     def _start_intro_fade(self):
-        if self.intro_fade_animation is None:
-            self.intro_fade_animation = QPropertyAnimation(self.intro_opacity_effect, b"opacity", self)
-            self.intro_fade_animation.setDuration(1500)
-            self.intro_fade_animation.setStartValue(1.0)
-            self.intro_fade_animation.setEndValue(0.0)
-            self.intro_fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
-            self.intro_fade_animation.finished.connect(self._on_intro_fade_finished)
-
         if self.intro_fade_animation.state() != QAbstractAnimation.State.Running:
             self.intro_fade_animation.start()
 
     def _on_intro_fade_finished(self):
-        self.intro_label.setText("Demo Mode")
+        self.intro_label.set_final_text("Demo Mode")
         self.intro_opacity_effect.setOpacity(1.0)
 
 
@@ -3389,7 +4166,7 @@ def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
+    raise SystemExit(app.exec())
 
 
 if __name__ == "__main__":